@@ -12,7 +12,6 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 
 import click
-import yaml
 
 from .core.converter import MainConverter
 from .core.exceptions import ConversionError
@@ -72,6 +71,8 @@ def load_config(config_file: Optional[str] = None) -> Dict[str, Any]:
 
     # Load from file if provided
     if config_file and Path(config_file).exists():
+        import yaml
+
         try:
             with open(config_file, "r") as f:
                 config = yaml.safe_load(f) or {}
@@ -2,19 +2,36 @@
 Parsers module for the markdown converter.
 
 This module contains all document parsers for different file formats.
+Format-specific parsers are imported on first access so that importing
+the package does not pull in pandas, python-docx, pdfplumber or pypandoc
+until a parser that needs them is actually used.
 """
 
-from .base import BaseParser, ParserRegistry, ParserResult, parser_registry
-from .excel_parser import ExcelParser
-from .html_parser import HTMLParser
-from .pandoc_parser import PandocParser
-from .pdf_parser import PDFParser
-from .word_parser import WordParser
+from importlib import import_module
+from typing import Any, List
+
+from .base import (
+    BaseParser,
+    ParserRegistry,
+    ParserResult,
+    SpooledParserResult,
+    parser_registry,
+)
+
+# Maps lazily exported parser names to the submodule defining them
+_LAZY_PARSERS = {
+    "WordParser": ".word_parser",
+    "PDFParser": ".pdf_parser",
+    "ExcelParser": ".excel_parser",
+    "HTMLParser": ".html_parser",
+    "PandocParser": ".pandoc_parser",
+}
 
 __all__ = [
     "BaseParser",
     "ParserRegistry",
     "ParserResult",
+    "SpooledParserResult",
     "parser_registry",
     "WordParser",
     "PDFParser",
@@ -22,3 +39,25 @@ __all__ = [
     "HTMLParser",
     "PandocParser",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import format-specific parsers on first access (PEP 562).
+
+    :param name: Attribute name being looked up
+    :return: The requested parser class
+    :raises: AttributeError if the name is not a known parser
+    """
+    module_name = _LAZY_PARSERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    parser_class = getattr(import_module(module_name, __name__), name)
+    globals()[name] = parser_class
+    return parser_class
+
+
+def __dir__() -> List[str]:
+    """List module attributes including the lazily imported parsers."""
+    return sorted(set(globals()) | set(_LAZY_PARSERS))
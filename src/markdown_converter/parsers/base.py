@@ -7,10 +7,13 @@ All format-specific parsers must implement this interface.
 
 import logging
 import os
+import pickle
+import stat
+import tempfile
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import IO, Any, Dict, Iterator, List, Optional, Union
 
 from ..core.exceptions import ParserError
 
@@ -34,6 +37,93 @@ class ParserResult:
         if self.messages is None:
             self.messages = []
 
+    def iter_content(self, chunk_size: int = 1 << 20) -> Iterator[str]:
+        """
+        Iterate over the content in chunks.
+
+        :param chunk_size: Maximum number of characters per chunk
+        :return: Iterator of content chunks
+        """
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start : start + chunk_size]
+
+
+class SpooledParserResult(ParserResult):
+    """
+    ParserResult whose content is kept in a spooled temporary file.
+
+    The content stays in memory up to the spool's size limit and on disk
+    beyond it, and only becomes a single string when ``content`` is read.
+    Callers that write the result out can use :meth:`iter_content` and
+    never hold the whole document as one string.
+    """
+
+    def __init__(
+        self,
+        spool: IO[str],
+        metadata: Dict[str, Any],
+        format: str,
+        messages: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Initialize the result from a filled spool.
+
+        :param spool: Text file holding the content; owned by the result
+        :param metadata: Document metadata
+        :param format: Content format
+        :param messages: Parser messages
+        """
+        self._spool = spool
+        self._content: Optional[str] = None
+        self.metadata = metadata
+        self.format = format
+        self.messages = messages if messages is not None else []
+
+    @property
+    def content(self) -> str:
+        """Content as a string, read from the spool on first access."""
+        if self._content is None:
+            self._spool.seek(0)
+            self._content = self._spool.read()
+            self._release_spool()
+        return self._content
+
+    @content.setter
+    def content(self, value: str) -> None:
+        self._content = value
+        self._release_spool()
+
+    def iter_content(self, chunk_size: int = 1 << 20) -> Iterator[str]:
+        """
+        Iterate over the content in chunks, straight from the spool if unread.
+
+        :param chunk_size: Maximum number of characters per chunk
+        :return: Iterator of content chunks
+        """
+        if self._spool is None:
+            yield from super().iter_content(chunk_size)
+            return
+
+        self._spool.seek(0)
+        while chunk := self._spool.read(chunk_size):
+            yield chunk
+
+    def close(self) -> None:
+        """Discard the content and close the spool if it was never read."""
+        if self._content is None and self._spool is not None:
+            self._content = ""
+        self._release_spool()
+
+    def _release_spool(self) -> None:
+        """Close the spool once the content is held as a string."""
+        if self._spool is not None:
+            self._spool.close()
+            self._spool = None
+
+    def __reduce__(self):
+        """Pickle as a plain ParserResult; open files cannot be pickled."""
+        return (ParserResult, (self.content, self.metadata, self.format, self.messages))
+
 
 class BaseParser(ABC):
     """
@@ -84,24 +174,72 @@ class BaseParser(ABC):
         """
         pass
 
-    def validate_file(self, file_path: Union[str, Path]) -> None:
+    def validate_file(self, file_path: Union[str, Path]) -> os.stat_result:
         """
         Validate that the file exists and is readable.
 
+        A single ``stat`` call backs the existence and file-type checks,
+        and readability is checked with ``os.access``. The stat result is
+        returned so callers can hand it to :meth:`_extract_metadata`
+        instead of stat-ing the file again.
+
         :param file_path: Path to the file to validate
+        :return: Stat result for the file
         :raises: ParserError if file is invalid
         """
         path = Path(file_path)
 
-        if not path.exists():
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
             raise ParserError(f"File does not exist: {path}")
+        except OSError as e:
+            raise ParserError(f"Cannot access file {path}: {e}")
 
-        if not path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             raise ParserError(f"Path is not a file: {path}")
 
         if not os.access(path, os.R_OK):
             raise ParserError(f"File is not readable: {path}")
 
+        return st
+
+    def _load_cached_result(self, cache_file: Path) -> Optional[ParserResult]:
+        """
+        Load a cached ParserResult.
+
+        :param cache_file: Path of the cache entry
+        :return: The cached result, or None on a miss or unreadable entry
+        """
+        try:
+            with open(cache_file, "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable cache entry {cache_file}: {e}")
+            return None
+
+    def _store_cached_result(self, cache_file: Path, result: ParserResult) -> None:
+        """
+        Store a ParserResult in the cache.
+
+        The entry is written to a temporary file and moved into place, so
+        concurrent readers never see a partial pickle.
+
+        :param cache_file: Path of the cache entry
+        :param result: Result to cache
+        """
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=cache_file.parent, suffix=".tmp", delete=False
+            ) as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(f.name, cache_file)
+        except Exception as e:
+            self.logger.warning(f"Failed to write cache entry {cache_file}: {e}")
+
     def _validate_config(self) -> None:
         """
         Validate the parser configuration.
@@ -123,22 +261,27 @@ class BaseParser(ABC):
         """Log parsing error."""
         self.logger.error(f"Failed to parse {file_path}: {error}")
 
-    def _extract_metadata(self, file_path: Union[str, Path]) -> Dict[str, Any]:
+    def _extract_metadata(
+        self,
+        file_path: Union[str, Path],
+        stat_result: Optional[os.stat_result] = None,
+    ) -> Dict[str, Any]:
         """
         Extract basic metadata from the file.
 
         :param file_path: Path to the file
+        :param stat_result: Stat result from :meth:`validate_file`, if available
         :return: Dictionary containing basic metadata
         """
         path = Path(file_path)
-        stat = path.stat()
+        st = stat_result if stat_result is not None else os.stat(path)
 
         return {
             "filename": path.name,
-            "file_size": stat.st_size,
+            "file_size": st.st_size,
             "file_extension": path.suffix.lower(),
-            "created_time": stat.st_ctime,
-            "modified_time": stat.st_mtime,
+            "created_time": st.st_ctime,
+            "modified_time": st.st_mtime,
         }
 
 
@@ -153,15 +296,28 @@ class ParserRegistry:
     def __init__(self) -> None:
         """Initialize the parser registry."""
         self._parsers: List[BaseParser] = []
+        self._by_ext: Dict[str, BaseParser] = {}
         self.logger = logging.getLogger("ParserRegistry")
 
     def register_parser(self, parser: BaseParser) -> None:
         """
         Register a parser with the registry.
 
+        Extensions already claimed by an earlier parser keep their original
+        owner, so registration order still decides precedence.
+
         :param parser: Parser instance to register
         """
         self._parsers.append(parser)
+        for extension in parser.get_supported_formats():
+            extension = extension.lower()
+            owner = self._by_ext.setdefault(extension, parser)
+            if owner is not parser:
+                self.logger.debug(
+                    f"Extension {extension} already handled by "
+                    f"{owner.__class__.__name__}, "
+                    f"not registering {parser.__class__.__name__}"
+                )
         self.logger.info(f"Registered parser: {parser.__class__.__name__}")
 
     def get_parser_for_file(self, file_path: Union[str, Path]) -> Optional[BaseParser]:
@@ -171,11 +327,7 @@ class ParserRegistry:
         :param file_path: Path to the file
         :return: Parser instance that can handle the file, or None
         """
-        for parser in self._parsers:
-            if parser.can_parse(file_path):
-                return parser
-
-        return None
+        return self._by_ext.get(Path(file_path).suffix.lower())
 
     def get_supported_formats(self) -> List[str]:
         """
@@ -183,10 +335,7 @@ class ParserRegistry:
 
         :return: List of all supported file extensions
         """
-        formats = []
-        for parser in self._parsers:
-            formats.extend(parser.get_supported_formats())
-        return list(set(formats))  # Remove duplicates
+        return list(self._by_ext)
 
     def list_parsers(self) -> List[str]:
         """
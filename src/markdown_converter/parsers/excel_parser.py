@@ -2,24 +2,59 @@
 Excel Document Parser
 
 This module provides specialized parsing for Excel documents (.xlsx, .xls)
-using openpyxl for spreadsheet processing and pandas for data manipulation.
+using python-calamine when available, with pandas and openpyxl as fallbacks.
 """
 
+import contextlib
+import functools
+import hashlib
+import io
+import itertools
 import logging
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, time
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from ..core.exceptions import ParserError, UnsupportedFormatError
-from .base import BaseParser, ParserResult
+from .base import BaseParser, ParserResult, SpooledParserResult
+
+# (table markdown, or None for an empty sheet; row count; column count)
+SheetResult = Tuple[Optional[str], int, int]
+
+# File extensions handled by this parser, in get_supported_formats() order
+EXCEL_SUFFIXES = (".xlsx", ".xls", ".xlsb")
+
+# Worksheet grid limits since Excel 2007
+EXCEL_MAX_ROWS = 1_048_576
+EXCEL_MAX_COLUMNS = 16_384
 
 
 class ExcelParser(BaseParser):
     """
     Specialized parser for Excel documents (.xlsx, .xls).
 
-    Uses openpyxl for spreadsheet processing and pandas for data manipulation.
+    Uses the Rust-based python-calamine reader when available, falling back
+    to pandas for data manipulation and openpyxl for spreadsheet processing.
     """
 
+    # Backend availability, shared by all instances (see _check_dependencies)
+    _dependency_cache: Optional[Dict[str, bool]] = None
+
     def __init__(self, config: Optional[Dict[str, Any]] = None) -> None:
         """
         Initialize the Excel parser.
@@ -34,11 +69,18 @@ class ExcelParser(BaseParser):
     def _setup_default_config(self) -> None:
         """Setup default configuration for Excel parsing."""
         self.default_config = {
+            # Preferred engine: "calamine" (falls back to pandas, then openpyxl),
+            # "polars" (needs polars and fastexcel), "pandas" or "openpyxl"
+            "engine": "calamine",
             # openpyxl options
             "openpyxl_options": {
                 "data_only": True,  # Read values, not formulas
                 "keep_vba": False,
+                "keep_links": False,  # Skip parsing external workbook links
                 "read_only": True,
+                # Stop reading a sheet after this many consecutive empty rows
+                # (None to read every row)
+                "max_empty_rows": 1000,
             },
             # pandas options
             "pandas_options": {
@@ -50,10 +92,22 @@ class ExcelParser(BaseParser):
             # Output settings
             "include_all_sheets": True,
             "max_sheets": 10,  # Limit number of sheets to process
+            # Stop extracting a sheet once it reaches this many cells (None for
+            # no limit); bounds memory on huge or malformed sheets
+            "max_cells_per_sheet": 5_000_000,
             "convert_tables": True,
             "include_formulas": False,
             "include_charts": False,
             "preserve_formatting": False,
+            # Parallel sheet parsing (process pool, used for large workbooks)
+            "parallel_sheets": True,
+            "parallel_min_file_size": 5 * 1024 * 1024,  # 5MB
+            "sheet_workers": None,  # Defaults to CPU count
+            # Markdown output beyond this many characters is spooled to disk
+            "spool_max_size": 64 * 1024 * 1024,
+            # Directory for cached results, reused while the file is unchanged
+            # (None disables caching)
+            "cache_dir": None,
         }
 
         # Merge with user config
@@ -62,24 +116,54 @@ class ExcelParser(BaseParser):
 
     def _validate_dependencies(self) -> None:
         """Validate that required dependencies are available."""
-        try:
-            import openpyxl
+        available = self._check_dependencies()
 
-            self.openpyxl_available = True
-        except ImportError:
-            self.openpyxl_available = False
-            self.logger.warning("openpyxl not available")
+        self.calamine_available = available["python_calamine"]
+        if not self.calamine_available:
+            self.logger.debug("python-calamine not available")
 
-        try:
-            import pandas
+        self.openpyxl_available = available["openpyxl"]
+        if not self.openpyxl_available:
+            self.logger.warning("openpyxl not available")
 
-            self.pandas_available = True
-        except ImportError:
-            self.pandas_available = False
+        self.pandas_available = available["pandas"]
+        if not self.pandas_available:
             self.logger.warning("pandas not available")
 
-        if not self.openpyxl_available and not self.pandas_available:
-            raise ParserError("Neither openpyxl nor pandas are available")
+        self.polars_available = available["polars"] and available["fastexcel"]
+        if not self.polars_available:
+            self.logger.debug("polars/fastexcel not available")
+
+        if not (
+            self.calamine_available or self.openpyxl_available or self.pandas_available
+        ):
+            raise ParserError(
+                "None of python-calamine, openpyxl or pandas are available"
+            )
+
+    @classmethod
+    def _check_dependencies(cls) -> Dict[str, bool]:
+        """
+        Look up the optional backends once per process.
+
+        Modules are located with ``find_spec`` rather than imported, so
+        constructing a parser does not pay for importing pandas, and a
+        missing backend is not searched for again on every construction.
+
+        :return: Mapping of module name to availability
+        """
+        if cls._dependency_cache is None:
+            cls._dependency_cache = {
+                module: find_spec(module) is not None
+                for module in (
+                    "python_calamine",
+                    "openpyxl",
+                    "pandas",
+                    "polars",
+                    "fastexcel",
+                )
+            }
+        return cls._dependency_cache
 
     def can_parse(self, file_path: Union[str, Path]) -> bool:
         """
@@ -88,8 +172,7 @@ class ExcelParser(BaseParser):
         :param file_path: Path to the file
         :return: True if the file can be parsed
         """
-        file_path = Path(file_path)
-        return file_path.suffix.lower() in [".xlsx", ".xls", ".xlsb"]
+        return Path(file_path).suffix.lower() in EXCEL_SUFFIXES
 
     def parse(self, file_path: Union[str, Path]) -> ParserResult:
         """
@@ -104,265 +187,644 @@ class ExcelParser(BaseParser):
         if not self.can_parse(file_path):
             raise UnsupportedFormatError(f"Cannot parse {file_path.suffix} files")
 
+        # Stat once; every backend reuses the result for its metadata
+        stat_result = self.validate_file(file_path)
+
+        cache_file = self._cache_file(file_path, stat_result)
+        if cache_file is not None:
+            cached = self._load_cached_result(cache_file)
+            if cached is not None:
+                self.logger.debug(f"Using cached result for {file_path}")
+                return cached
+
         self.logger.info(f"Parsing Excel document: {file_path}")
 
-        # Check if file needs conversion (e.g., .xlsb -> .xlsx)
-        converted_file = self._ensure_readable_format(file_path)
+        result = self._parse_file(file_path, stat_result)
+
+        if cache_file is not None:
+            self._store_cached_result(cache_file, result)
+
+        return result
+
+    def _parse_file(self, file_path: Path, stat_result: os.stat_result) -> ParserResult:
+        """
+        Parse an Excel document with the configured backends.
+
+        :param file_path: Path to the Excel document
+        :param stat_result: Stat result from :meth:`validate_file`
+        :return: ParserResult with extracted content and metadata
+        :raises: ParserError if parsing fails
+        """
+        engine = self.default_config["engine"]
+
+        if engine == "polars" and self.polars_available:
+            try:
+                return self._parse_with_polars(file_path, stat_result)
+            except Exception as e:
+                self.logger.warning(f"polars parsing failed: {e}, trying pandas")
 
+        # calamine reads .xlsx/.xls/.xlsb natively, so no conversion is needed
+        calamine_tried = engine == "calamine" and self.calamine_available
+        if calamine_tried:
+            try:
+                return self._parse_with_calamine(file_path, stat_result)
+            except Exception as e:
+                self.logger.warning(f"calamine parsing failed: {e}, trying pandas")
+
+        # pandas reads .xls/.xlsb directly when xlrd/pyxlsb are installed
         try:
-            # Try pandas first (preferred for data analysis)
-            if self.pandas_available:
+            return self._parse_with_fallbacks(file_path, stat_result)
+        except Exception as e:
+            error = e
+
+        if file_path.suffix.lower() in (".xls", ".xlsb"):
+            # openpyxl cannot read these; prefer calamine over a conversion
+            if not calamine_tried and self.calamine_available:
                 try:
-                    return self._parse_with_pandas(converted_file)
+                    return self._parse_with_calamine(file_path, stat_result)
                 except Exception as e:
-                    self.logger.warning(f"pandas parsing failed: {e}, trying openpyxl")
+                    self.logger.warning(f"calamine parsing failed: {e}")
 
-            # Fallback to openpyxl
-            if self.openpyxl_available:
-                return self._parse_with_openpyxl(converted_file)
+            # Last resort: convert to .xlsx on disk and parse the copy
+            converted_file = self._ensure_readable_format(file_path)
+            if converted_file != file_path:
+                try:
+                    # Report the size of the file actually parsed
+                    return self._parse_with_fallbacks(converted_file, None)
+                except Exception as e:
+                    error = e
+                finally:
+                    if self.default_config.get("cleanup_temp_files", True):
+                        self._cleanup_converted_file(converted_file)
 
-            raise ParserError("No available Excel parser found")
+        self.logger.error(f"Excel parsing failed for {file_path}: {error}")
+        raise ParserError(f"Failed to parse Excel document {file_path}: {error}")
 
-        except Exception as e:
-            self.logger.error(f"Excel parsing failed for {file_path}: {e}")
-            raise ParserError(f"Failed to parse Excel document {file_path}: {e}")
-        finally:
-            # Clean up converted file if it's different from original
-            if converted_file != file_path and self.default_config.get(
-                "cleanup_temp_files", True
-            ):
-                self._cleanup_converted_file(converted_file)
+    def _cache_file(
+        self, file_path: Path, stat_result: os.stat_result
+    ) -> Optional[Path]:
+        """
+        Get the result cache entry for a file, if caching is enabled.
+
+        The key covers the resolved path, modification time and size of the
+        file as well as the package version and parser config, so an edited
+        file or a changed option never returns a stale result.
 
-    def _parse_with_pandas(self, file_path: Path) -> ParserResult:
+        :param file_path: Path to the Excel document
+        :param stat_result: Stat result from :meth:`validate_file`
+        :return: Path of the cache entry, or None if caching is disabled
         """
-        Parse Excel document using pandas.
+        cache_dir = self.default_config["cache_dir"]
+        if not cache_dir:
+            return None
+
+        from .. import __version__
+
+        key_source = "|".join(
+            [
+                str(file_path.resolve()),
+                str(stat_result.st_mtime_ns),
+                str(stat_result.st_size),
+                __version__,
+                repr(sorted(self.default_config.items())),
+            ]
+        )
+        # Not security sensitive; blake2b is just a fast, well-spread hash
+        key = hashlib.blake2b(key_source.encode(), digest_size=16).hexdigest()
+        return Path(cache_dir).expanduser() / f"{key}.pkl"
+
+    def _parse_with_fallbacks(
+        self, file_path: Path, stat_result: Optional[os.stat_result] = None
+    ) -> ParserResult:
+        """
+        Parse with pandas, falling back to openpyxl.
 
         :param file_path: Path to the Excel document
+        :param stat_result: Stat result from :meth:`validate_file`, if available
         :return: ParserResult with extracted content
+        :raises: ParserError if no backend is available
         """
-        import pandas as pd
+        # Try pandas first (preferred for data analysis)
+        if self.default_config["engine"] != "openpyxl" and self.pandas_available:
+            try:
+                return self._parse_with_pandas(file_path, stat_result)
+            except Exception as e:
+                if not self.openpyxl_available:
+                    raise
+                self.logger.warning(f"pandas parsing failed: {e}, trying openpyxl")
 
-        self.logger.debug(f"Using pandas to parse {file_path}")
+        # Fallback to openpyxl
+        if self.openpyxl_available:
+            return self._parse_with_openpyxl(file_path, stat_result)
 
-        content_parts = []
-        sheets_data = []
-        metadata = {
-            "parser": "pandas",
-            "file_path": str(file_path),
-            "file_size": file_path.stat().st_size,
-            "format": file_path.suffix.lower(),
-        }
+        raise ParserError("No available Excel parser found")
 
-        # Read all sheets
-        excel_file = pd.ExcelFile(file_path)
-        sheet_names = excel_file.sheet_names
+    def _parse_with_calamine(
+        self, file_path: Path, stat_result: Optional[os.stat_result] = None
+    ) -> ParserResult:
+        """
+        Parse Excel document using python-calamine.
 
-        metadata["sheet_count"] = len(sheet_names)
-        metadata["sheet_names"] = sheet_names
+        Cell values are read straight into Python lists by the Rust reader,
+        skipping openpyxl's per-cell objects and pandas' DataFrame build.
 
-        # Process each sheet
-        for sheet_name in sheet_names[: self.default_config["max_sheets"]]:
-            self.logger.debug(f"Processing sheet: {sheet_name}")
+        :param file_path: Path to the Excel document
+        :param stat_result: Stat result from :meth:`validate_file`, if available
+        :return: ParserResult with extracted content
+        """
+        from python_calamine import CalamineWorkbook
 
-            try:
-                # Read sheet data
-                df = pd.read_excel(
-                    file_path,
-                    sheet_name=sheet_name,
-                    **self.default_config["pandas_options"],
-                )
+        self.logger.debug(f"Using python-calamine to parse {file_path}")
 
-                if not df.empty:
-                    # Add sheet header
-                    content_parts.append(f"# Sheet: {sheet_name}")
-                    content_parts.append("")
-
-                    # Convert DataFrame to markdown table
-                    table_markdown = self._dataframe_to_markdown(df)
-                    content_parts.append(table_markdown)
-                    content_parts.append("")  # Add blank line
-
-                    # Store sheet data
-                    sheets_data.append(
-                        {
-                            "name": sheet_name,
-                            "rows": len(df),
-                            "columns": len(df.columns),
-                            "content": table_markdown,
-                        }
-                    )
+        metadata = self._base_metadata("calamine", file_path, stat_result)
 
-            except Exception as e:
-                self.logger.warning(f"Failed to process sheet {sheet_name}: {e}")
-                content_parts.append(f"# Sheet: {sheet_name}")
-                content_parts.append("*Error processing this sheet*")
-                content_parts.append("")
+        workbook = CalamineWorkbook.from_path(str(file_path))
+        sheet_names = workbook.sheet_names
 
-        # Combine all content
-        content = "\n".join(content_parts)
+        sheets = self._schedule_sheets(
+            None,
+            _calamine_sheet_to_markdown,
+            workbook,
+            sheet_names[: self.default_config["max_sheets"]],
+            self.default_config["max_cells_per_sheet"],
+        )
+        return self._build_result(metadata, sheet_names, sheets)
 
-        # Add sheets metadata
-        if sheets_data:
-            metadata["sheets"] = sheets_data
+    def _parse_with_polars(
+        self, file_path: Path, stat_result: Optional[os.stat_result] = None
+    ) -> ParserResult:
+        """
+        Parse Excel document using polars (via fastexcel's calamine reader).
+
+        Sheets are loaded into Arrow-backed DataFrames and every cell is
+        rendered to text by polars expressions in native code, so no Python
+        object is created per cell before the markdown rows are built.
+
+        :param file_path: Path to the Excel document
+        :param stat_result: Stat result from :meth:`validate_file`, if available
+        :return: ParserResult with extracted content
+        """
+        import fastexcel
+
+        self.logger.debug(f"Using polars to parse {file_path}")
 
-        return ParserResult(
-            content=content, metadata=metadata, format="markdown", messages=[]
+        metadata = self._base_metadata("polars", file_path, stat_result)
+
+        reader = fastexcel.read_excel(str(file_path))
+        sheet_names = reader.sheet_names
+
+        sheets = self._schedule_sheets(
+            None,
+            _polars_sheet_to_markdown,
+            reader,
+            sheet_names[: self.default_config["max_sheets"]],
+            self.default_config["max_cells_per_sheet"],
         )
+        return self._build_result(metadata, sheet_names, sheets)
 
-    def _parse_with_openpyxl(self, file_path: Path) -> ParserResult:
+    def _parse_with_pandas(
+        self, file_path: Path, stat_result: Optional[os.stat_result] = None
+    ) -> ParserResult:
         """
-        Parse Excel document using openpyxl.
+        Parse Excel document using pandas.
 
         :param file_path: Path to the Excel document
+        :param stat_result: Stat result from :meth:`validate_file`, if available
         :return: ParserResult with extracted content
         """
-        from openpyxl import load_workbook
+        import pandas as pd
+
+        self.logger.debug(f"Using pandas to parse {file_path}")
+
+        metadata = self._base_metadata("pandas", file_path, stat_result)
+
+        pandas_options = self.default_config["pandas_options"]
+        max_cells = self.default_config["max_cells_per_sheet"]
+
+        # Open the workbook once and parse every sheet from it
+        with pd.ExcelFile(file_path) as excel_file:
+            sheet_names = excel_file.sheet_names
+            target_sheets = sheet_names[: self.default_config["max_sheets"]]
+
+            with self._sheet_executor(
+                metadata["file_size"], len(target_sheets)
+            ) as executor:
+                if executor is None:
+                    sheets = self._schedule_sheets(
+                        None,
+                        _pandas_sheet_to_markdown,
+                        excel_file,
+                        target_sheets,
+                        pandas_options,
+                        max_cells,
+                    )
+                else:
+                    # ExcelFile doesn't pickle; each worker opens its own
+                    sheets = self._schedule_sheets(
+                        executor,
+                        _parse_single_sheet_pandas,
+                        file_path,
+                        target_sheets,
+                        pandas_options,
+                        max_cells,
+                    )
+                return self._build_result(metadata, sheet_names, sheets)
+
+    def _parse_with_openpyxl(
+        self, file_path: Path, stat_result: Optional[os.stat_result] = None
+    ) -> ParserResult:
+        """
+        Parse Excel document using openpyxl.
 
+        :param file_path: Path to the Excel document
+        :param stat_result: Stat result from :meth:`validate_file`, if available
+        :return: ParserResult with extracted content
+        """
         self.logger.debug(f"Using openpyxl to parse {file_path}")
 
-        content_parts = []
-        sheets_data = []
-        metadata = {
-            "parser": "openpyxl",
+        metadata = self._base_metadata("openpyxl", file_path, stat_result)
+        openpyxl_options = self.default_config["openpyxl_options"]
+        max_cells = self.default_config["max_cells_per_sheet"]
+
+        # Load workbook
+        workbook = _load_openpyxl_workbook(file_path, openpyxl_options)
+
+        try:
+            sheet_names = workbook.sheetnames
+            target_sheets = sheet_names[: self.default_config["max_sheets"]]
+
+            with self._sheet_executor(
+                metadata["file_size"], len(target_sheets)
+            ) as executor:
+                if executor is None:
+                    sheets = self._schedule_sheets(
+                        None,
+                        _openpyxl_sheet_to_markdown,
+                        workbook,
+                        target_sheets,
+                        openpyxl_options,
+                        max_cells,
+                    )
+                else:
+                    # Worksheets don't pickle; each worker opens its own workbook
+                    sheets = self._schedule_sheets(
+                        executor,
+                        _parse_single_sheet_openpyxl,
+                        file_path,
+                        target_sheets,
+                        openpyxl_options,
+                        max_cells,
+                    )
+                return self._build_result(metadata, sheet_names, sheets)
+        finally:
+            workbook.close()
+
+    def _base_metadata(
+        self,
+        parser_name: str,
+        file_path: Path,
+        stat_result: Optional[os.stat_result] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build the metadata shared by all parsing backends.
+
+        :param parser_name: Name of the backend producing the result
+        :param file_path: Path to the Excel document
+        :param stat_result: Stat result from :meth:`validate_file`, if available
+        :return: Dictionary of metadata
+        """
+        if stat_result is None:
+            stat_result = file_path.stat()
+
+        return {
+            "parser": parser_name,
             "file_path": str(file_path),
-            "file_size": file_path.stat().st_size,
+            "file_size": stat_result.st_size,
             "format": file_path.suffix.lower(),
         }
 
-        # Load workbook
-        workbook = load_workbook(
-            file_path,
-            data_only=self.default_config["openpyxl_options"]["data_only"],
-            read_only=self.default_config["openpyxl_options"]["read_only"],
+    def _sheet_executor(
+        self, file_size: int, sheet_count: int
+    ) -> ContextManager[Optional[ProcessPoolExecutor]]:
+        """
+        Create a process pool for per-sheet parsing when it is worthwhile.
+
+        Small workbooks are parsed in-process: starting workers and importing
+        pandas/openpyxl in each of them costs more than it saves.
+
+        :param file_size: Size of the workbook in bytes
+        :param sheet_count: Number of sheets that will be processed
+        :return: A ProcessPoolExecutor, or a null context yielding None
+        """
+        config = self.default_config
+        if (
+            not config["parallel_sheets"]
+            or sheet_count < 2
+            or file_size < config["parallel_min_file_size"]
+        ):
+            return contextlib.nullcontext()
+
+        workers = min(sheet_count, config["sheet_workers"] or os.cpu_count() or 1)
+        if workers < 2:
+            return contextlib.nullcontext()
+
+        self.logger.debug(f"Parsing {sheet_count} sheets with {workers} processes")
+        return ProcessPoolExecutor(max_workers=workers)
+
+    def _schedule_sheets(
+        self,
+        executor: Optional[ProcessPoolExecutor],
+        parse_sheet: Callable[..., SheetResult],
+        source: Any,
+        sheet_names: List[str],
+        *args: Any,
+    ) -> List[Tuple[str, Callable[[], SheetResult]]]:
+        """
+        Schedule ``parse_sheet(source, sheet_name, *args)`` for each sheet.
+
+        Without an executor the calls are deferred and run in-process when
+        collected; with one they are submitted up front so sheets parse
+        concurrently. Either way results are collected in sheet order.
+
+        :param executor: Process pool to submit to, or None to run in-process
+        :param parse_sheet: Function converting one sheet to a SheetResult
+        :param source: Workbook object or file path passed to ``parse_sheet``
+        :param sheet_names: Sheets to process, in output order
+        :return: List of (sheet name, callable returning its SheetResult)
+        """
+        if executor is None:
+            return [
+                (name, functools.partial(parse_sheet, source, name, *args))
+                for name in sheet_names
+            ]
+
+        return [
+            (name, executor.submit(parse_sheet, source, name, *args).result)
+            for name in sheet_names
+        ]
+
+    def _build_result(
+        self,
+        metadata: Dict[str, Any],
+        sheet_names: List[str],
+        sheets: List[Tuple[str, Callable[[], SheetResult]]],
+    ) -> ParserResult:
+        """
+        Collect per-sheet results into a ParserResult.
+
+        :param metadata: Backend metadata to extend
+        :param sheet_names: All sheet names in the workbook
+        :param sheets: Scheduled sheets from :meth:`_schedule_sheets`
+        :return: ParserResult with extracted content
+        """
+        # In memory for typical workbooks, on disk past spool_max_size
+        spool = tempfile.SpooledTemporaryFile(
+            max_size=self.default_config["spool_max_size"],
+            mode="w+",
+            encoding="utf-8",
+            newline="",
         )
+        pos = 0  # Characters written; tell() is opaque once the spool rolls over
+        sheets_data = []
 
-        sheet_names = workbook.sheetnames
         metadata["sheet_count"] = len(sheet_names)
         metadata["sheet_names"] = sheet_names
 
-        # Process each sheet
-        for sheet_name in sheet_names[: self.default_config["max_sheets"]]:
-            self.logger.debug(f"Processing sheet: {sheet_name}")
+        try:
+            # Process each sheet
+            for sheet_name, get_sheet in sheets:
+                self.logger.debug("Processing sheet: %s", sheet_name)
 
-            try:
-                worksheet = workbook[sheet_name]
-
-                # Extract data from worksheet
-                sheet_data = self._extract_worksheet_data(worksheet)
-
-                if sheet_data:
-                    # Add sheet header
-                    content_parts.append(f"# Sheet: {sheet_name}")
-                    content_parts.append("")
-
-                    # Convert to markdown table
-                    table_markdown = self._convert_data_to_markdown(sheet_data)
-                    content_parts.append(table_markdown)
-                    content_parts.append("")  # Add blank line
-
-                    # Store sheet data
-                    sheets_data.append(
-                        {
-                            "name": sheet_name,
-                            "rows": len(sheet_data),
-                            "columns": len(sheet_data[0]) if sheet_data else 0,
-                            "content": table_markdown,
-                        }
+                try:
+                    table_markdown, rows, columns = get_sheet()
+                except Exception as e:
+                    self.logger.warning(f"Failed to process sheet {sheet_name}: {e}")
+                    if pos:
+                        pos += spool.write("\n")
+                    pos += spool.write(
+                        f"# Sheet: {sheet_name}\n*Error processing this sheet*\n"
                     )
-
-            except Exception as e:
-                self.logger.warning(f"Failed to process sheet {sheet_name}: {e}")
-                content_parts.append(f"# Sheet: {sheet_name}")
-                content_parts.append("*Error processing this sheet*")
-                content_parts.append("")
-
-        workbook.close()
-
-        # Combine all content
-        content = "\n".join(content_parts)
+                    continue
+
+                if table_markdown is None:
+                    continue
+
+                # Sheets are separated by a blank line
+                if pos:
+                    pos += spool.write("\n")
+
+                # Add sheet header and markdown table
+                pos += spool.write(f"# Sheet: {sheet_name}\n\n")
+                start = pos
+                pos += spool.write(table_markdown)
+                end = pos
+                pos += spool.write("\n")
+
+                # Store sheet data; the table itself is content[start:end]
+                sheets_data.append(
+                    {
+                        "name": sheet_name,
+                        "rows": rows,
+                        "columns": columns,
+                        "content_span": (start, end),
+                    }
+                )
+        except BaseException:
+            spool.close()
+            raise
 
         # Add sheets metadata
         if sheets_data:
             metadata["sheets"] = sheets_data
 
-        return ParserResult(
-            content=content, metadata=metadata, format="markdown", messages=[]
+        return SpooledParserResult(
+            spool, metadata=metadata, format="markdown", messages=[]
         )
 
-    def _extract_worksheet_data(self, worksheet) -> List[List[str]]:
+    @staticmethod
+    def _extract_worksheet_data(
+        worksheet,
+        max_empty_rows: Optional[int] = None,
+        max_cells: Optional[int] = None,
+    ) -> Tuple[List[List[str]], bool]:
         """
         Extract data from a worksheet.
 
         :param worksheet: openpyxl worksheet object
-        :return: List of rows (each row is a list of cell values)
+        :param max_empty_rows: Stop after this many consecutive empty rows
+        :param max_cells: Stop before the kept rows exceed this many cells
+        :return: List of rows (each row is a list of cell values), and
+            whether the sheet was truncated at ``max_cells``
         """
-        data = []
+        ExcelParser._reset_bogus_dimensions(worksheet)
+        return ExcelParser._extract_row_data(
+            worksheet.iter_rows(values_only=True), max_empty_rows, max_cells
+        )
 
-        # Get the used range
-        for row in worksheet.iter_rows(values_only=True):
-            # Convert all values to strings and clean them
-            row_data = []
-            for cell_value in row:
-                if cell_value is None:
-                    cell_text = ""
-                else:
-                    cell_text = str(cell_value).strip()
-                row_data.append(cell_text)
+    @staticmethod
+    def _reset_bogus_dimensions(worksheet) -> None:
+        """
+        Discard the stored dimensions of a read-only worksheet if unreliable.
 
-            # Only add non-empty rows
-            if any(cell.strip() for cell in row_data):
-                data.append(row_data)
+        Read-only worksheets size every row from the ``<dimension>`` element
+        written by the producing application. Some writers leave it at
+        ``A1`` (truncating data to the first column) or claim the full grid,
+        padding every row to 16384 cells. Resetting makes openpyxl size rows
+        from the cells that are actually present.
 
-        return data
+        :param worksheet: openpyxl worksheet object
+        """
+        if not hasattr(worksheet, "reset_dimensions"):
+            return  # Regular worksheets compute dimensions from their cells
+
+        max_row, max_column = worksheet.max_row, worksheet.max_column
+        if max_row is None or max_column is None:
+            return  # Already unsized
+
+        if (max_row, max_column) == (1, 1) or (
+            max_row >= EXCEL_MAX_ROWS or max_column >= EXCEL_MAX_COLUMNS
+        ):
+            logging.getLogger("ExcelParser").debug(
+                "Ignoring reported dimensions %s of sheet %s",
+                worksheet.calculate_dimension(),
+                worksheet.title,
+            )
+            worksheet.reset_dimensions()
+
+    @staticmethod
+    def _extract_row_data(
+        rows: Iterable[Sequence[Any]],
+        max_empty_rows: Optional[int] = None,
+        max_cells: Optional[int] = None,
+    ) -> Tuple[List[List[str]], bool]:
+        """
+        Convert raw row values to cleaned strings, dropping empty rows.
 
-    def _dataframe_to_markdown(self, df) -> str:
+        :param rows: Iterable of rows (each row is a sequence of cell values)
+        :param max_empty_rows: Stop after this many consecutive empty rows
+        :param max_cells: Stop before the kept rows exceed this many cells
+        :return: List of rows (each row is a list of cell values), and
+            whether the sheet was truncated at ``max_cells``
+        """
+        data = []
+        empty_run = 0
+        cell_budget = max_cells
+        truncated = False
+        _str = str  # Local lookup in the per-cell loop
+
+        for row in rows:
+            # Convert all values to stripped strings. Only text cells can carry
+            # surrounding whitespace; numbers and dates are rendered as-is.
+            row_data = [
+                (
+                    ""
+                    if cell_value is None
+                    else (
+                        cell_value.strip()
+                        if type(cell_value) is _str
+                        else _str(cell_value)
+                    )
+                )
+                for cell_value in row
+            ]
+
+            # Only add non-empty rows (cells are already stripped)
+            if any(row_data):
+                if cell_budget is not None:
+                    cell_budget -= len(row_data)
+                    if cell_budget < 0:
+                        truncated = True
+                        break
+                data.append(row_data)
+                empty_run = 0
+            else:
+                empty_run += 1
+                if max_empty_rows is not None and empty_run >= max_empty_rows:
+                    break
+
+        # Unsized read-only sheets yield rows only as wide as their last cell
+        width = max((len(row) for row in data), default=0)
+        for row in data:
+            if len(row) < width:
+                row.extend([""] * (width - len(row)))
+
+        return data, truncated
+
+    @staticmethod
+    def _dataframe_to_markdown(df, max_cells: Optional[int] = None) -> str:
         """
         Convert a pandas DataFrame to markdown table.
 
         :param df: pandas DataFrame
+        :param max_cells: Truncate the table before it exceeds this many cells
         :return: Markdown table string
         """
         if df.empty:
             return "*Empty sheet*"
 
-        # Convert DataFrame to markdown
-        markdown_table = df.to_markdown(index=False)
+        if max_cells is not None:
+            # Only convert the rows that can fit (plus one to detect the cut)
+            df = df.head(max_cells // max(len(df.columns), 1) + 1)
 
-        return markdown_table
+        # Render with the same table writer as the other backends rather than
+        # DataFrame.to_markdown(), whose tabulate backend pads and aligns every
+        # cell in pure Python and rounds floats to six significant digits
+        header = [str(column) for column in df.columns]
+        rows = df.to_numpy(dtype=object, na_value=None).tolist()
+        rows = ([_normalise_cell_value(value) for value in row] for row in rows)
 
-    def _convert_data_to_markdown(self, data: List[List[str]]) -> str:
+        data, truncated = ExcelParser._extract_row_data(
+            itertools.chain([header], rows), max_cells=max_cells
+        )
+        return _with_truncation_note(
+            ExcelParser._convert_data_to_markdown(data), truncated, max_cells
+        )
+
+    @staticmethod
+    def _convert_data_to_markdown(data: List[List[str]]) -> str:
         """
         Convert data to markdown table format.
 
+        Rows are written one at a time rather than collected and joined, so
+        large sheets do not hold a list of row strings next to the table.
+
         :param data: List of rows (each row is a list of cell values)
         :return: Markdown table string
         """
+        out = io.StringIO()
+
         if not data or not data[0]:
-            return "*Empty sheet*"
+            out.write("*Empty sheet*")
+            return out.getvalue()
 
-        markdown_lines = []
+        write = out.write
 
-        # Process each row
-        for i, row in enumerate(data):
-            # Clean and escape cell content
-            cells = []
-            for cell in row:
-                if cell is None:
-                    cell_text = ""
-                else:
-                    cell_text = str(cell).strip().replace("|", "\\|")
-                cells.append(cell_text)
+        # Header row, then the separator row
+        write(f"| {ExcelParser._markdown_row_cells(data[0])} |\n")
+        write(_separator_row(len(data[0])))
+
+        # Each data row is formatted into a single string and written once
+        for row in data[1:]:
+            write(f"\n| {ExcelParser._markdown_row_cells(row)} |")
+
+        return out.getvalue()
 
-            # Create markdown row
-            markdown_row = "| " + " | ".join(cells) + " |"
-            markdown_lines.append(markdown_row)
+    @staticmethod
+    def _markdown_row_cells(row: List[str]) -> str:
+        """
+        Escape and join the cells of one markdown table row.
+
+        :param row: Row of already stripped cell strings
+        :return: Cells joined with ``" | "``, without the outer pipes
+        """
+        # Escape pipes per cell, before they are joined with pipes
+        line = " | ".join([cell.replace("|", "\\|") for cell in row])
 
-            # Add separator row after header
-            if i == 0:
-                separator = "| " + " | ".join(["---"] * len(cells)) + " |"
-                markdown_lines.append(separator)
+        # Line breaks inside a cell would end the table row
+        if "\n" in line or "\r" in line:
+            line = line.replace("\r", "").replace("\n", " ")
 
-        return "\n".join(markdown_lines)
+        return line
 
     def get_supported_formats(self) -> List[str]:
         """
@@ -370,7 +832,7 @@ class ExcelParser(BaseParser):
 
         :return: List of supported format extensions
         """
-        return [".xlsx", ".xls", ".xlsb"]
+        return list(EXCEL_SUFFIXES)
 
     def _ensure_readable_format(self, file_path: Path) -> Path:
         """
@@ -389,13 +851,9 @@ class ExcelParser(BaseParser):
                     self.logger.info(f"Converting {file_path} to readable format")
                     return converter.convert_file(file_path)
             except ImportError:
-                self.logger.warning(
-                    "FileConverter not available, trying direct parsing"
-                )
+                self.logger.warning("FileConverter not available, cannot convert file")
             except Exception as e:
-                self.logger.warning(
-                    f"File conversion failed: {e}, trying direct parsing"
-                )
+                self.logger.warning(f"File conversion failed: {e}")
 
         return file_path
 
@@ -423,8 +881,275 @@ class ExcelParser(BaseParser):
             "description": "Specialized parser for Excel documents",
             "supported_formats": self.get_supported_formats(),
             "dependencies": {
+                "python-calamine": self.calamine_available,
                 "openpyxl": self.openpyxl_available,
                 "pandas": self.pandas_available,
+                "polars": self.polars_available,
             },
             "config": self.default_config,
         }
+
+
+@functools.lru_cache(maxsize=128)
+def _separator_row(column_count: int) -> str:
+    """
+    Build the markdown separator row for a table with this many columns.
+
+    :param column_count: Number of table columns
+    :return: Separator row, e.g. ``| --- | --- |``
+    """
+    return "| --- " * column_count + "|"
+
+
+# Per-sheet workers. These live at module level so they can be pickled and
+# run in a ProcessPoolExecutor as well as in-process.
+
+
+def _sheet_result(
+    extracted: Tuple[List[List[str]], bool], max_cells: Optional[int] = None
+) -> SheetResult:
+    """
+    Render extracted sheet rows as a markdown table.
+
+    :param extracted: Rows and truncation flag from ``_extract_row_data``
+    :param max_cells: Cell limit the rows were extracted with
+    :return: SheetResult for the sheet
+    """
+    sheet_data, truncated = extracted
+    if not sheet_data:
+        return None, 0, 0
+
+    return (
+        _with_truncation_note(
+            ExcelParser._convert_data_to_markdown(sheet_data), truncated, max_cells
+        ),
+        len(sheet_data),
+        len(sheet_data[0]),
+    )
+
+
+def _with_truncation_note(
+    table_markdown: str, truncated: bool, max_cells: Optional[int]
+) -> str:
+    """
+    Append a note to a table that was cut off at the cell limit.
+
+    :param table_markdown: Markdown table for the sheet
+    :param truncated: Whether extraction stopped at ``max_cells``
+    :param max_cells: Cell limit the sheet was extracted with
+    :return: Markdown table, followed by the note if truncated
+    """
+    if not truncated:
+        return table_markdown
+
+    logging.getLogger("ExcelParser").warning(
+        "Sheet truncated at %s cells (max_cells_per_sheet)", max_cells
+    )
+    return f"{table_markdown}\n\n*Sheet truncated at {max_cells} cells*"
+
+
+def _calamine_sheet_to_markdown(
+    workbook, sheet_name: str, max_cells: Optional[int] = None
+) -> SheetResult:
+    """
+    Convert one sheet of an open python-calamine workbook.
+
+    :param workbook: python-calamine CalamineWorkbook
+    :param sheet_name: Name of the sheet to convert
+    :param max_cells: Stop extracting the sheet beyond this many cells
+    :return: SheetResult for the sheet
+    """
+    # Rows are pulled one at a time instead of materialising the whole sheet
+    # as a list of lists with to_python()
+    rows = workbook.get_sheet_by_name(sheet_name).iter_rows()
+    rows = ([_normalise_cell_value(value) for value in row] for row in rows)
+    return _sheet_result(
+        ExcelParser._extract_row_data(rows, max_cells=max_cells), max_cells
+    )
+
+
+def _normalise_cell_value(value: Any) -> Any:
+    """
+    Normalise a python-calamine or pandas cell value to what openpyxl returns.
+
+    calamine reports every number as a float and date-only cells as dates,
+    and pandas turns integer columns with gaps into floats, whereas openpyxl
+    keeps integers as ints and always returns datetimes.
+
+    :param value: Cell value from python-calamine or pandas
+    :return: Equivalent openpyxl-style value
+    """
+    value_type = type(value)
+    if value_type is float and value.is_integer():
+        return int(value)
+    if value_type is date:
+        return datetime.combine(value, time.min)
+    return value
+
+
+def _polars_sheet_to_markdown(
+    reader, sheet_name: str, max_cells: Optional[int] = None
+) -> SheetResult:
+    """
+    Convert one sheet of an open fastexcel reader via polars.
+
+    :param reader: fastexcel ExcelReader
+    :param sheet_name: Name of the sheet to convert
+    :param max_cells: Stop extracting the sheet beyond this many cells
+    :return: SheetResult for the sheet
+    """
+    import polars as pl
+
+    df = reader.load_sheet(sheet_name).to_polars()
+    if df.height == 0:
+        return None, 0, 0
+
+    if max_cells is not None:
+        # Only render the rows that can fit (plus one to detect the cut)
+        df = df.head(max_cells // max(df.width, 1) + 1)
+
+    # Render cells the way the other backends do (integral floats as ints,
+    # dates as datetimes, blanks as empty strings) without leaving polars
+    columns = []
+    for name, dtype in df.schema.items():
+        column = pl.col(name)
+        if dtype.is_float():
+            text = (
+                pl.when(column.is_finite() & (column.round(0) == column))
+                .then(column.cast(pl.Int64, strict=False).cast(pl.Utf8))
+                .otherwise(column.cast(pl.Utf8))
+            )
+        elif dtype == pl.Date:
+            text = column.dt.strftime("%Y-%m-%d 00:00:00")
+        elif dtype == pl.Datetime:
+            text = column.dt.strftime("%Y-%m-%d %H:%M:%S")
+        elif dtype == pl.Boolean:
+            text = pl.when(column).then(pl.lit("True")).otherwise(pl.lit("False"))
+        else:
+            text = column.cast(pl.Utf8)
+        columns.append(text.fill_null("").alias(name))
+
+    rows = df.select(columns).iter_rows()
+    header = [str(name) for name in df.columns]
+    return _sheet_result(
+        ExcelParser._extract_row_data(
+            itertools.chain([header], rows), max_cells=max_cells
+        ),
+        max_cells,
+    )
+
+
+def _openpyxl_sheet_to_markdown(
+    workbook,
+    sheet_name: str,
+    openpyxl_options: Dict[str, Any],
+    max_cells: Optional[int] = None,
+) -> SheetResult:
+    """
+    Convert one sheet of an open openpyxl workbook.
+
+    :param workbook: openpyxl Workbook
+    :param sheet_name: Name of the sheet to convert
+    :param openpyxl_options: openpyxl options from the parser config
+    :param max_cells: Stop extracting the sheet beyond this many cells
+    :return: SheetResult for the sheet
+    """
+    return _sheet_result(
+        ExcelParser._extract_worksheet_data(
+            workbook[sheet_name], openpyxl_options.get("max_empty_rows"), max_cells
+        ),
+        max_cells,
+    )
+
+
+def _load_openpyxl_workbook(file_path: Path, openpyxl_options: Dict[str, Any]):
+    """
+    Open a workbook with openpyxl, skipping parts the parser never reads.
+
+    :param file_path: Path to the Excel document
+    :param openpyxl_options: openpyxl options from the parser config
+    :return: openpyxl Workbook
+    """
+    from openpyxl import load_workbook
+
+    return load_workbook(
+        file_path,
+        read_only=openpyxl_options.get("read_only", True),
+        data_only=openpyxl_options.get("data_only", True),
+        keep_vba=openpyxl_options.get("keep_vba", False),
+        keep_links=openpyxl_options.get("keep_links", False),
+        rich_text=False,
+    )
+
+
+def _parse_single_sheet_openpyxl(
+    file_path: Path,
+    sheet_name: str,
+    openpyxl_options: Dict[str, Any],
+    max_cells: Optional[int] = None,
+) -> SheetResult:
+    """
+    Open a workbook with openpyxl and convert a single sheet.
+
+    :param file_path: Path to the Excel document
+    :param sheet_name: Name of the sheet to convert
+    :param openpyxl_options: openpyxl options from the parser config
+    :param max_cells: Stop extracting the sheet beyond this many cells
+    :return: SheetResult for the sheet
+    """
+    workbook = _load_openpyxl_workbook(file_path, openpyxl_options)
+    try:
+        return _openpyxl_sheet_to_markdown(
+            workbook, sheet_name, openpyxl_options, max_cells
+        )
+    finally:
+        workbook.close()
+
+
+def _parse_single_sheet_pandas(
+    file_path: Path,
+    sheet_name: str,
+    pandas_options: Dict[str, Any],
+    max_cells: Optional[int] = None,
+) -> SheetResult:
+    """
+    Read a single sheet with pandas and convert it.
+
+    :param file_path: Path to the Excel document
+    :param sheet_name: Name of the sheet to convert
+    :param pandas_options: pandas options from the parser config
+    :param max_cells: Truncate the sheet's table beyond this many cells
+    :return: SheetResult for the sheet
+    """
+    import pandas as pd
+
+    with pd.ExcelFile(file_path) as excel_file:
+        return _pandas_sheet_to_markdown(
+            excel_file, sheet_name, pandas_options, max_cells
+        )
+
+
+def _pandas_sheet_to_markdown(
+    excel_file,
+    sheet_name: str,
+    pandas_options: Dict[str, Any],
+    max_cells: Optional[int] = None,
+) -> SheetResult:
+    """
+    Convert one sheet of an open pandas ExcelFile.
+
+    :param excel_file: pandas ExcelFile
+    :param sheet_name: Name of the sheet to convert
+    :param pandas_options: pandas options from the parser config
+    :param max_cells: Truncate the sheet's table beyond this many cells
+    :return: SheetResult for the sheet
+    """
+    df = excel_file.parse(sheet_name=sheet_name, **pandas_options)
+    if df.empty:
+        return None, 0, 0
+
+    return (
+        ExcelParser._dataframe_to_markdown(df, max_cells),
+        len(df),
+        len(df.columns),
+    )
@@ -2,16 +2,48 @@
 HTML Document Parser
 
 This module provides specialized parsing for HTML documents (.html, .htm)
-using beautifulsoup4 for HTML parsing and cleaning.
+using lxml for markdown conversion and beautifulsoup4 for HTML parsing and
+cleaning.
 """
 
+import functools
 import logging
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 from ..core.exceptions import ParserError, UnsupportedFormatError
 from .base import BaseParser, ParserResult
 
+try:
+    from bs4 import NavigableString
+except ImportError:  # Reported by HTMLParser._validate_dependencies
+    NavigableString = None
+
+try:
+    from lxml import etree
+
+    # Text of an element and its descendants, as lxml's text_content()
+    _string_value = etree.XPath("string()")
+except ImportError:  # The lxml engine is skipped without lxml
+    etree = None
+
+# Row groups whose <tr> children belong to the enclosing table
+_TABLE_SECTIONS = ("thead", "tbody", "tfoot")
+
+# Markdown prefix for each heading tag
+_HEADING_MARKERS = {f"h{level}": "#" * level for level in range(1, 7)}
+
+# Block tags emitted by the markdown conversion
+_BLOCK_TAGS = frozenset(("p", "table", "ul", "ol", *_HEADING_MARKERS))
+
+# Tags the markdown conversion and metadata extraction read; with
+# convert_to_markdown the tree is built from these subtrees only
+_MARKDOWN_TAGS = _BLOCK_TAGS | {"title", "meta", "a", "img"}
+
 
 class HTMLParser(BaseParser):
     """
@@ -34,8 +66,11 @@ class HTMLParser(BaseParser):
     def _setup_default_config(self) -> None:
         """Setup default configuration for HTML parsing."""
         self.default_config = {
+            # Markdown engine: "lxml" (walks the lxml tree directly, falls back
+            # to beautifulsoup4) or "beautifulsoup4"
+            "engine": "lxml",
             # BeautifulSoup options
-            "parser": "html.parser",  # or "lxml", "html5lib"
+            "parser": "lxml",  # or "html.parser", "html5lib"
             "extract_text": True,
             "extract_tables": True,
             "extract_images": True,
@@ -49,6 +84,9 @@ class HTMLParser(BaseParser):
             # Output options
             "convert_to_markdown": True,
             "include_metadata": True,
+            # Files larger than this are converted by the lxml engine while
+            # streaming, without keeping the whole tree in memory
+            "stream_threshold": 10 * 1024 * 1024,  # 10MB
         }
 
         # Merge with user config
@@ -68,6 +106,17 @@ class HTMLParser(BaseParser):
         if not self.beautifulsoup_available:
             raise ParserError("beautifulsoup4 is required for HTML parsing")
 
+        # Only whether lxml is installed matters here, so it is not imported
+        self.lxml_available = find_spec("lxml") is not None
+
+        if self.default_config["parser"] == "lxml" and not self.lxml_available:
+            self.logger.warning("lxml not available, falling back to html.parser")
+            self.default_config["parser"] = "html.parser"
+
+        self.logger.debug(
+            f"Using BeautifulSoup tree builder: {self.default_config['parser']}"
+        )
+
     def can_parse(self, file_path: Union[str, Path]) -> bool:
         """
         Check if this parser can handle the given file.
@@ -91,34 +140,279 @@ class HTMLParser(BaseParser):
         if not self.can_parse(file_path):
             raise UnsupportedFormatError(f"Cannot parse {file_path.suffix} files")
 
+        # Stat once; every engine reuses the result for its metadata
+        stat_result = self.validate_file(file_path)
+
         self.logger.info(f"Parsing HTML document: {file_path}")
 
+        # The lxml engine only produces markdown; clean HTML output uses bs4
+        if (
+            self.default_config["engine"] == "lxml"
+            and self.lxml_available
+            and self.default_config["convert_to_markdown"]
+        ):
+            try:
+                if stat_result.st_size > self.default_config["stream_threshold"]:
+                    return self._parse_with_lxml_streaming(file_path, stat_result)
+                return self._parse_with_lxml(file_path, stat_result)
+            except Exception as e:
+                self.logger.warning(f"lxml parsing failed: {e}, trying beautifulsoup4")
+
         try:
-            return self._parse_with_beautifulsoup(file_path)
+            return self._parse_with_beautifulsoup(file_path, stat_result)
         except Exception as e:
             self.logger.error(f"HTML parsing failed for {file_path}: {e}")
             raise ParserError(f"Failed to parse HTML document {file_path}: {e}")
 
-    def _parse_with_beautifulsoup(self, file_path: Path) -> ParserResult:
+    @classmethod
+    def parse_many(
+        cls,
+        file_paths: List[Union[str, Path]],
+        config: Optional[Dict[str, Any]] = None,
+        workers: Optional[int] = None,
+    ) -> List[ParserResult]:
+        """
+        Parse several HTML documents in parallel worker processes.
+
+        Tree building is CPU-bound Python, so documents are spread over a
+        process pool; each worker builds its own parser from ``config`` and
+        only the plain ParserResult is sent back.
+
+        :param file_paths: Paths to the HTML documents
+        :param config: Configuration dictionary for the parsers
+        :param workers: Number of worker processes (defaults to CPU count)
+        :return: ParserResult per document, in input order
+        :raises: ParserError if parsing any document fails
+        """
+        parse_file = functools.partial(_parse_html_file, config=config)
+
+        workers = min(len(file_paths), workers or os.cpu_count() or 1)
+        if workers < 2:
+            return [parse_file(file_path) for file_path in file_paths]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(parse_file, file_paths))
+
+    def _parse_with_lxml(
+        self, file_path: Path, stat_result: Optional[os.stat_result] = None
+    ) -> ParserResult:
+        """
+        Parse HTML document into markdown by walking the lxml tree directly.
+
+        :param file_path: Path to the HTML document
+        :param stat_result: Stat result from :meth:`validate_file`, if available
+        :return: ParserResult with markdown content
+        """
+        import lxml.html
+
+        self.logger.debug(f"Using lxml to parse {file_path}")
+
+        with open(file_path, "rb") as f:
+            html_content = f.read()
+
+        root = lxml.html.document_fromstring(
+            html_content, parser=lxml.html.HTMLParser(encoding="utf-8")
+        )
+
+        metadata = self._extract_lxml_metadata(root, file_path, stat_result)
+
+        if self.default_config["remove_scripts"]:
+            for script in list(root.iter("script", "style")):
+                script.drop_tree()
+
+        return ParserResult(
+            content=self._lxml_to_markdown(root),
+            metadata=metadata,
+            format="markdown",
+            messages=[],
+        )
+
+    def _extract_lxml_metadata(
+        self, root, file_path: Path, stat_result: Optional[os.stat_result] = None
+    ) -> Dict[str, Any]:
+        """
+        Extract metadata from an lxml HTML tree.
+
+        :param root: Root element of the lxml tree
+        :param file_path: Path to the HTML file
+        :param stat_result: Stat result from :meth:`validate_file`, if available
+        :return: Dictionary of metadata
+        """
+        metadata = self._base_metadata("lxml", file_path, stat_result)
+
+        tag_counts: Counter = Counter()
+        title = None
+        meta_entries: Dict[str, str] = {}
+        for element in root.iter():
+            name = element.tag
+            if not isinstance(name, str):  # Comments, processing instructions
+                continue
+            tag_counts[name] += 1
+            if name == "title" and title is None:
+                title = _lxml_text(element)
+            elif name == "meta":
+                _add_meta_entry(meta_entries, element.attrib)
+
+        _add_document_metadata(metadata, title, meta_entries, tag_counts)
+        return metadata
+
+    def _lxml_to_markdown(self, root) -> str:
+        """
+        Convert an lxml HTML tree to markdown.
+
+        :param root: Root element of the lxml tree
+        :return: Markdown content
+        """
+        content_parts = []
+
+        # Extract title
+        title_tag = next(root.iter("title"), None)
+        if title_tag is not None:
+            title = _lxml_text(title_tag)
+            if title:
+                content_parts.append(f"# {title}")
+
+        # Extract headings and content
+        for element in root.iter(*_BLOCK_TAGS):
+            block = _lxml_block_to_markdown(element)
+            if block:
+                content_parts.append(block)
+
+        return _join_blocks(content_parts)
+
+    def _parse_with_lxml_streaming(
+        self, file_path: Path, stat_result: Optional[os.stat_result] = None
+    ) -> ParserResult:
+        """
+        Parse a large HTML document into markdown without keeping its tree.
+
+        Each block is converted when its end tag is parsed, and elements
+        outside any open block are cleared once they end, so memory follows
+        the largest block instead of the whole document. Blocks get an
+        output slot when they start, keeping nested blocks in the same order
+        as :meth:`_lxml_to_markdown`.
+
+        :param file_path: Path to the HTML document
+        :param stat_result: Stat result from :meth:`validate_file`, if available
+        :return: ParserResult with markdown content
+        """
+        self.logger.debug(f"Using lxml to stream {file_path}")
+
+        parser = etree.HTMLPullParser(events=("start", "end"), encoding="utf-8")
+        remove_scripts = self.default_config["remove_scripts"]
+
+        tag_counts: Counter = Counter()
+        title = None
+        meta_entries: Dict[str, str] = {}
+        blocks: List[str] = []  # Markdown per block, in start tag order
+        open_blocks: List[int] = []  # Slots of blocks not yet ended
+
+        def handle_events() -> None:
+            nonlocal title
+            for event, element in parser.read_events():
+                name = element.tag
+                if not isinstance(name, str):  # Comments, processing instructions
+                    continue
+
+                if event == "start":
+                    tag_counts[name] += 1
+                    if name == "meta":
+                        _add_meta_entry(meta_entries, element.attrib)
+                    elif name in _BLOCK_TAGS:
+                        open_blocks.append(len(blocks))
+                        blocks.append("")
+                    continue
+
+                if name == "title" and title is None:
+                    title = _lxml_text(element)
+                elif remove_scripts and name in ("script", "style"):
+                    element.clear(keep_tail=True)
+                elif name in _BLOCK_TAGS:
+                    blocks[open_blocks.pop()] = _lxml_block_to_markdown(element)
+
+                # Blocks still open may need this subtree for their text
+                if not open_blocks:
+                    element.clear(keep_tail=True)
+                    parent = element.getparent()
+                    if parent is not None:  # Siblings of the root cannot go
+                        while element.getprevious() is not None:
+                            del parent[0]
+
+        with open(file_path, "rb") as f:
+            while chunk := f.read(1 << 16):
+                parser.feed(chunk)
+                handle_events()
+        parser.close()
+        handle_events()
+
+        metadata = self._base_metadata("lxml", file_path, stat_result)
+        _add_document_metadata(metadata, title, meta_entries, tag_counts)
+
+        if title:
+            blocks.insert(0, f"# {title}")
+
+        return ParserResult(
+            content=_join_blocks([block for block in blocks if block]),
+            metadata=metadata,
+            format="markdown",
+            messages=[],
+        )
+
+    def _base_metadata(
+        self,
+        parser_name: str,
+        file_path: Path,
+        stat_result: Optional[os.stat_result] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build the metadata entries shared by all HTML engines.
+
+        :param parser_name: Name of the engine that parsed the document
+        :param file_path: Path to the HTML file
+        :param stat_result: Stat result from :meth:`validate_file`, if available
+        :return: Dictionary of metadata
+        """
+        if stat_result is None:
+            stat_result = file_path.stat()
+
+        return {
+            "parser": parser_name,
+            "file_path": str(file_path),
+            "file_size": stat_result.st_size,
+            "format": "html",
+        }
+
+    def _parse_with_beautifulsoup(
+        self, file_path: Path, stat_result: Optional[os.stat_result] = None
+    ) -> ParserResult:
         """
         Parse HTML document using beautifulsoup4.
 
         :param file_path: Path to the HTML document
+        :param stat_result: Stat result from :meth:`validate_file`, if available
         :return: ParserResult with extracted content
         """
-        from bs4 import BeautifulSoup
+        from bs4 import BeautifulSoup, SoupStrainer
 
         self.logger.debug(f"Using beautifulsoup4 to parse {file_path}")
 
-        # Read HTML file
-        with open(file_path, "r", encoding="utf-8") as f:
+        # Read HTML file; bs4 decodes the bytes itself with the given encoding
+        with open(file_path, "rb") as f:
             html_content = f.read()
 
-        # Parse HTML
-        soup = BeautifulSoup(html_content, self.default_config["parser"])
+        # Parse HTML, skipping subtrees the markdown conversion never reads
+        parse_only = None
+        if self.default_config["convert_to_markdown"]:
+            parse_only = SoupStrainer(_MARKDOWN_TAGS)
+        soup = BeautifulSoup(
+            html_content,
+            self.default_config["parser"],
+            parse_only=parse_only,
+            from_encoding="utf-8",
+        )
 
         # Extract metadata
-        metadata = self._extract_metadata(soup, file_path)
+        metadata = self._extract_metadata(soup, file_path, stat_result)
 
         # Clean HTML if needed
         if self.default_config["remove_scripts"]:
@@ -135,48 +429,35 @@ class HTMLParser(BaseParser):
             messages=[],
         )
 
-    def _extract_metadata(self, soup, file_path: Path) -> Dict[str, Any]:
+    def _extract_metadata(
+        self, soup, file_path: Path, stat_result: Optional[os.stat_result] = None
+    ) -> Dict[str, Any]:
         """
         Extract metadata from HTML document.
 
         :param soup: BeautifulSoup object
         :param file_path: Path to the HTML file
+        :param stat_result: Stat result from :meth:`validate_file`, if available
         :return: Dictionary of metadata
         """
-        metadata = {
-            "parser": "beautifulsoup4",
-            "file_path": str(file_path),
-            "file_size": file_path.stat().st_size,
-            "format": "html",
-        }
-
-        # Extract title
-        title_tag = soup.find("title")
-        if title_tag:
-            metadata["title"] = title_tag.get_text().strip()
-
-        # Extract meta tags
-        meta_tags = soup.find_all("meta")
-        for meta in meta_tags:
-            name = meta.get("name", meta.get("property", ""))
-            content = meta.get("content", "")
-            if name and content:
-                metadata[f"meta_{name}"] = content
-
-        # Extract document structure info
-        metadata["headings"] = {
-            "h1": len(soup.find_all("h1")),
-            "h2": len(soup.find_all("h2")),
-            "h3": len(soup.find_all("h3")),
-            "h4": len(soup.find_all("h4")),
-            "h5": len(soup.find_all("h5")),
-            "h6": len(soup.find_all("h6")),
-        }
-
-        metadata["links"] = len(soup.find_all("a"))
-        metadata["images"] = len(soup.find_all("img"))
-        metadata["tables"] = len(soup.find_all("table"))
-
+        metadata = self._base_metadata("beautifulsoup4", file_path, stat_result)
+
+        # Count tags and collect title/meta elements in one walk of the tree
+        tag_counts: Counter = Counter()
+        title_tag = None
+        meta_entries: Dict[str, str] = {}
+        for element in soup.descendants:
+            name = element.name
+            if name is None:
+                continue
+            tag_counts[name] += 1
+            if name == "title" and title_tag is None:
+                title_tag = element
+            elif name == "meta":
+                _add_meta_entry(meta_entries, element.attrs)
+
+        title = _soup_text(title_tag) if title_tag else None
+        _add_document_metadata(metadata, title, meta_entries, tag_counts)
         return metadata
 
     def _extract_content(self, soup) -> str:
@@ -203,41 +484,34 @@ class HTMLParser(BaseParser):
         # Extract title
         title_tag = soup.find("title")
         if title_tag:
-            title = title_tag.get_text().strip()
+            title = _soup_text(title_tag)
             if title:
                 content_parts.append(f"# {title}")
-                content_parts.append("")
 
         # Extract headings and content
-        for element in soup.find_all(
-            ["h1", "h2", "h3", "h4", "h5", "h6", "p", "table", "ul", "ol"]
-        ):
-            if element.name.startswith("h"):
-                level = int(element.name[1])
-                text = element.get_text().strip()
+        for element in soup.find_all(_BLOCK_TAGS):
+            marker = _HEADING_MARKERS.get(element.name)
+            if marker is not None:
+                text = _soup_text(element)
                 if text:
-                    content_parts.append(f"{'#' * level} {text}")
-                    content_parts.append("")
+                    content_parts.append(f"{marker} {text}")
 
             elif element.name == "p":
-                text = element.get_text().strip()
+                text = _soup_text(element)
                 if text:
                     content_parts.append(text)
-                    content_parts.append("")
 
             elif element.name == "table":
                 table_markdown = self._convert_table_to_markdown(element)
                 if table_markdown:
                     content_parts.append(table_markdown)
-                    content_parts.append("")
 
             elif element.name in ["ul", "ol"]:
                 list_markdown = self._convert_list_to_markdown(element)
                 if list_markdown:
                     content_parts.append(list_markdown)
-                    content_parts.append("")
 
-        return "\n".join(content_parts)
+        return _join_blocks(content_parts)
 
     def _convert_table_to_markdown(self, table_element) -> str:
         """
@@ -246,33 +520,12 @@ class HTMLParser(BaseParser):
         :param table_element: BeautifulSoup table element
         :return: Markdown table string
         """
-        rows = table_element.find_all("tr")
-        if not rows:
-            return ""
-
-        markdown_lines = []
-
-        for i, row in enumerate(rows):
-            cells = row.find_all(["td", "th"])
-            if not cells:
-                continue
-
-            # Convert cells to text
-            cell_texts = []
-            for cell in cells:
-                text = cell.get_text().strip().replace("|", "\\|")
-                cell_texts.append(text)
-
-            # Create markdown row
-            markdown_row = "| " + " | ".join(cell_texts) + " |"
-            markdown_lines.append(markdown_row)
-
-            # Add separator row after header
-            if i == 0:
-                separator = "| " + " | ".join(["---"] * len(cell_texts)) + " |"
-                markdown_lines.append(separator)
-
-        return "\n".join(markdown_lines)
+        return _table_rows_to_markdown(
+            [
+                [_soup_text(cell) for cell in row.children if cell.name in ("td", "th")]
+                for row in _soup_table_rows(table_element)
+            ]
+        )
 
     def _convert_list_to_markdown(self, list_element) -> str:
         """
@@ -281,19 +534,10 @@ class HTMLParser(BaseParser):
         :param list_element: BeautifulSoup list element
         :return: Markdown list string
         """
-        items = list_element.find_all("li")
-        if not items:
-            return ""
-
-        markdown_lines = []
-        marker = "- " if list_element.name == "ul" else "1. "
-
-        for item in items:
-            text = item.get_text().strip()
-            if text:
-                markdown_lines.append(f"{marker}{text}")
-
-        return "\n".join(markdown_lines)
+        return _list_items_to_markdown(
+            [_soup_text(item) for item in list_element.children if item.name == "li"],
+            ordered=list_element.name == "ol",
+        )
 
     def _extract_clean_html(self, soup) -> str:
         """
@@ -331,6 +575,226 @@ class HTMLParser(BaseParser):
             "name": "HTMLParser",
             "description": "Specialized parser for HTML documents",
             "supported_formats": self.get_supported_formats(),
-            "dependencies": {"beautifulsoup4": self.beautifulsoup_available},
+            "dependencies": {
+                "beautifulsoup4": self.beautifulsoup_available,
+                "lxml": self.lxml_available,
+            },
             "config": self.default_config,
         }
+
+
+def _parse_html_file(
+    file_path: Union[str, Path], config: Optional[Dict[str, Any]]
+) -> ParserResult:
+    """
+    Parse one HTML document with a fresh parser; used by worker processes.
+
+    :param file_path: Path to the HTML document
+    :param config: Configuration dictionary for the parser
+    :return: ParserResult for the document
+    """
+    return HTMLParser(config).parse(file_path)
+
+
+def _add_meta_entry(meta_entries: Dict[str, str], attrs: Dict[str, Any]) -> None:
+    """
+    Record a <meta> tag's content under its name or property.
+
+    :param meta_entries: Meta tag contents by name, updated in place
+    :param attrs: Attribute mapping of the <meta> element
+    """
+    name = attrs.get("name")
+    if name is None:
+        name = attrs.get("property", "")
+    content = attrs.get("content", "")
+    if name and content:
+        meta_entries[name] = content
+
+
+def _add_document_metadata(
+    metadata: Dict[str, Any],
+    title: Optional[str],
+    meta_entries: Dict[str, str],
+    tag_counts: Counter,
+) -> None:
+    """
+    Add title, meta tag and structure entries to HTML metadata.
+
+    :param metadata: Metadata dictionary to update
+    :param title: Text of the first <title> element, if any
+    :param meta_entries: Meta tag contents by name, from :func:`_add_meta_entry`
+    :param tag_counts: Number of elements per tag name
+    """
+    # Extract title
+    if title is not None:
+        metadata["title"] = title.strip()
+
+    # Extract meta tags
+    for name, content in meta_entries.items():
+        metadata[f"meta_{name}"] = content
+
+    # Extract document structure info
+    metadata["headings"] = {
+        "h1": tag_counts["h1"],
+        "h2": tag_counts["h2"],
+        "h3": tag_counts["h3"],
+        "h4": tag_counts["h4"],
+        "h5": tag_counts["h5"],
+        "h6": tag_counts["h6"],
+    }
+
+    metadata["links"] = tag_counts["a"]
+    metadata["images"] = tag_counts["img"]
+    metadata["tables"] = tag_counts["table"]
+
+
+def _lxml_block_to_markdown(element) -> str:
+    """
+    Convert one lxml block element (heading, paragraph, table or list).
+
+    :param element: lxml element whose tag is in ``_BLOCK_TAGS``
+    :return: Markdown for the block, or "" if it has no text
+    """
+    name = element.tag
+    marker = _HEADING_MARKERS.get(name)
+    if marker is not None:
+        text = _lxml_text(element)
+        return f"{marker} {text}" if text else ""
+
+    if name == "p":
+        return _lxml_text(element)
+
+    if name == "table":
+        return _table_rows_to_markdown(
+            [
+                [_lxml_text(cell) for cell in row.iterchildren("td", "th")]
+                for row in _lxml_table_rows(element)
+            ]
+        )
+
+    return _list_items_to_markdown(
+        [_lxml_text(item) for item in element.iterchildren("li")],
+        ordered=name == "ol",
+    )
+
+
+def _soup_text(element) -> str:
+    """
+    Get the stripped text of a BeautifulSoup element.
+
+    Elements holding a single string, the common case for headings, cells
+    and paragraphs, skip get_text()'s walk over the subtree.
+
+    :param element: BeautifulSoup element
+    :return: Element text without surrounding whitespace
+    """
+    contents = element.contents
+    # Exact type check: comments and other NavigableString subclasses are
+    # not part of get_text()
+    if len(contents) == 1 and type(contents[0]) is NavigableString:
+        return contents[0].strip()
+    return element.get_text().strip()
+
+
+def _lxml_text(element) -> str:
+    """
+    Get the stripped text of an lxml element.
+
+    Elements without children skip the XPath evaluation.
+
+    :param element: lxml element
+    :return: Element text without surrounding whitespace
+    """
+    if len(element) == 0:
+        return (element.text or "").strip()
+    return _string_value(element).strip()
+
+
+def _soup_table_rows(table_element) -> Iterator[Any]:
+    """
+    Yield the rows of a BeautifulSoup table, skipping rows of nested tables.
+
+    :param table_element: BeautifulSoup table element
+    :return: Iterator over the table's own <tr> elements
+    """
+    for child in table_element.children:
+        if child.name == "tr":
+            yield child
+        elif child.name in _TABLE_SECTIONS:
+            for row in child.children:
+                if row.name == "tr":
+                    yield row
+
+
+def _lxml_table_rows(table_element) -> Iterator[Any]:
+    """
+    Yield the rows of an lxml table, skipping rows of nested tables.
+
+    :param table_element: lxml table element
+    :return: Iterator over the table's own <tr> elements
+    """
+    for child in table_element.iterchildren("tr", *_TABLE_SECTIONS):
+        if child.tag == "tr":
+            yield child
+        else:
+            yield from child.iterchildren("tr")
+
+
+def _join_blocks(blocks: List[str]) -> str:
+    """
+    Join markdown blocks, separating them with a blank line.
+
+    :param blocks: Markdown blocks in document order
+    :return: Markdown content ending in a newline, or "" without blocks
+    """
+    if not blocks:
+        return ""
+    return "\n\n".join(blocks) + "\n"
+
+
+def _table_rows_to_markdown(rows: List[List[str]]) -> str:
+    """
+    Convert extracted table rows to a markdown table.
+
+    :param rows: Cell texts per <tr>, empty for rows without cells
+    :return: Markdown table string
+    """
+    if not rows:
+        return ""
+
+    # Inner cell text per line; the outer pipes are added in the final join
+    markdown_lines = []
+
+    for i, cell_texts in enumerate(rows):
+        if not cell_texts:
+            continue
+
+        # Most cells contain no pipe; skip the replace call for those
+        markdown_lines.append(
+            " | ".join(
+                [
+                    text.replace("|", "\\|") if "|" in text else text
+                    for text in cell_texts
+                ]
+            )
+        )
+
+        # Add separator row after header
+        if i == 0:
+            markdown_lines.append(" | ".join(["---"] * len(cell_texts)))
+
+    if not markdown_lines:
+        return ""
+    return "| " + " |\n| ".join(markdown_lines) + " |"
+
+
+def _list_items_to_markdown(items: List[str], ordered: bool) -> str:
+    """
+    Convert extracted list item texts to a markdown list.
+
+    :param items: Text of each <li>
+    :param ordered: Whether the list is an <ol>
+    :return: Markdown list string
+    """
+    marker = "1. " if ordered else "- "
+    return "\n".join(f"{marker}{text}" for text in items if text)
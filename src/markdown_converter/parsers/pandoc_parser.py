@@ -5,10 +5,13 @@ This module provides a unified parser interface for Pandoc, making it
 transparent within the parser registry architecture.
 """
 
+import functools
 import logging
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pypandoc
 from tenacity import (
@@ -21,6 +24,39 @@ from tenacity import (
 from ..core.exceptions import ParserError, UnsupportedFormatError
 from .base import BaseParser, ParserResult
 
+# Pandoc input format per file extension (only formats Pandoc supports)
+_FORMAT_MAP = {
+    ".docx": "docx",
+    ".html": "html",
+    ".htm": "html",
+    ".odt": "odt",
+    ".rtf": "rtf",
+    ".epub": "epub",
+    ".txt": "markdown",
+    ".md": "markdown",
+    ".markdown": "markdown",
+    ".rst": "rst",
+    ".org": "org",
+    ".textile": "textile",
+    ".mediawiki": "mediawiki",
+    ".csv": "csv",
+    ".tsv": "tsv",
+    ".ipynb": "ipynb",
+    ".tex": "latex",
+    ".latex": "latex",
+}
+
+# Leading bytes of common file types, for files without a known extension
+_FILE_SIGNATURES = {
+    b"PK\x03\x04": "docx",  # ZIP-based format
+    b"%PDF": "pdf",
+    b"<!DOCTYPE": "html",
+    b"<html": "html",
+    b"From:": "email",
+    b"Return-Path:": "email",
+}
+_SIGNATURE_LENGTHS = sorted({len(signature) for signature in _FILE_SIGNATURES})
+
 
 class PandocParser(BaseParser):
     """
@@ -60,6 +96,8 @@ class PandocParser(BaseParser):
             "extract_metadata": True,
             "preserve_formatting": True,
             "handle_errors_gracefully": True,
+            # Concurrent pandoc processes for convert_files
+            "batch_workers": None,  # Defaults to CPU count
             # Supported formats (Pandoc handles many formats)
             "supported_formats": [
                 # Document formats
@@ -93,6 +131,10 @@ class PandocParser(BaseParser):
         if self.config:
             self.default_config.update(self.config)
 
+        self._supported_set = frozenset(
+            extension.lower() for extension in self.default_config["supported_formats"]
+        )
+
     def _validate_dependencies(self) -> None:
         """Validate that Pandoc is available."""
         try:
@@ -122,47 +164,21 @@ class PandocParser(BaseParser):
         file_path = Path(file_path)
         extension = file_path.suffix.lower()
 
-        # Format mapping (only formats Pandoc actually supports)
-        format_map = {
-            ".docx": "docx",
-            ".html": "html",
-            ".htm": "html",
-            ".odt": "odt",
-            ".rtf": "rtf",
-            ".epub": "epub",
-            ".txt": "markdown",
-            ".md": "markdown",
-            ".markdown": "markdown",
-            ".rst": "rst",
-            ".org": "org",
-            ".textile": "textile",
-            ".mediawiki": "mediawiki",
-            ".csv": "csv",
-            ".tsv": "tsv",
-            ".ipynb": "ipynb",
-            ".tex": "latex",
-            ".latex": "latex",
-        }
-
-        if extension in format_map:
-            return format_map[extension]
+        if extension in _FORMAT_MAP:
+            return _FORMAT_MAP[extension]
 
         # Try to detect from file content
         try:
             with open(file_path, "rb") as f:
-                header = f.read(8)
-
-                # Check for common file signatures
-                if header.startswith(b"PK\x03\x04"):
-                    return "docx"  # ZIP-based format
-                elif header.startswith(b"%PDF"):
-                    return "pdf"
-                elif header.startswith(b"<!DOCTYPE") or header.startswith(b"<html"):
-                    return "html"
-                elif header.startswith(b"From:") or header.startswith(b"Return-Path:"):
-                    return "email"
-                else:
-                    return "markdown"  # Default to markdown
+                header = f.read(_SIGNATURE_LENGTHS[-1])
+
+            # One dict probe per signature length
+            for length in _SIGNATURE_LENGTHS:
+                detected = _FILE_SIGNATURES.get(header[:length])
+                if detected is not None:
+                    return detected
+
+            return "markdown"  # Default to markdown
 
         except Exception as e:
             self.logger.warning(f"Could not detect format for {file_path}: {e}")
@@ -196,12 +212,10 @@ class PandocParser(BaseParser):
         if input_format is None:
             input_format = self.detect_format(input_path)
 
-        # Setup options
-        conversion_options = self.default_config["pandoc_config"][
-            "markdown_settings"
-        ].copy()
+        # Setup options, only building a merged dict when overrides are given
+        conversion_options = self.default_config["pandoc_config"]["markdown_settings"]
         if options:
-            conversion_options.update(options)
+            conversion_options = {**conversion_options, **options}
 
         try:
             self.logger.info(
@@ -222,6 +236,44 @@ class PandocParser(BaseParser):
             self.logger.error(f"Pandoc conversion failed for {input_path}: {e}")
             raise ParserError(f"Failed to convert {input_path}: {e}")
 
+    def convert_files(
+        self,
+        input_paths: List[Union[str, Path]],
+        output_format: str = "markdown",
+        options: Optional[Dict[str, Any]] = None,
+    ) -> List[str]:
+        """
+        Convert several files, running their pandoc processes concurrently.
+
+        Every file still gets its own pandoc process, since a single pandoc
+        invocation merges its inputs into one document, but the processes
+        overlap instead of paying pandoc's startup time one after another.
+
+        :param input_paths: Paths to input files
+        :param output_format: Output format (default: markdown)
+        :param options: Additional pandoc options
+        :return: Converted content per file, in input order
+        :raises: ParserError if any conversion fails
+        """
+        if not input_paths:
+            return []
+
+        max_workers = min(
+            self.default_config["batch_workers"] or os.cpu_count() or 1,
+            len(input_paths),
+        )
+
+        # Threads suffice: each one just waits on its pandoc subprocess
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda input_path: self.convert_file(
+                        input_path, output_format=output_format, options=options
+                    ),
+                    input_paths,
+                )
+            )
+
     def _build_extra_args(self, options: Dict[str, Any]) -> List[str]:
         """
         Build extra arguments for pandoc command.
@@ -229,28 +281,30 @@ class PandocParser(BaseParser):
         :param options: Pandoc options dictionary
         :return: List of command line arguments
         """
-        args = []
-
-        for key, value in options.items():
-            if value is True:
-                args.append(f"--{key}")
-            elif value is False:
-                # For boolean false values, use the =false syntax
-                args.append(f"--{key}=false")
-            elif value is not None:
-                args.extend([f"--{key}", str(value)])
-
-        return args
+        # The value's type is part of the cache key: True == 1 and
+        # False == 0 would otherwise share an entry
+        option_items = tuple(
+            (key, type(value), value) for key, value in options.items()
+        )
+        try:
+            return list(_extra_args(option_items))
+        except TypeError:  # Unhashable option value, build without the cache
+            return list(_extra_args.__wrapped__(option_items))
 
-    def get_conversion_info(self, file_path: Union[str, Path]) -> Dict[str, Any]:
+    def get_conversion_info(
+        self,
+        file_path: Union[str, Path],
+        stat_result: Optional[os.stat_result] = None,
+    ) -> Dict[str, Any]:
         """
         Get information about a file for conversion.
 
         :param file_path: Path to the file
+        :param stat_result: Stat result for the file, if already available
         :return: Dictionary with conversion information
         """
         file_path = Path(file_path)
-        stat = file_path.stat()
+        stat = stat_result if stat_result is not None else file_path.stat()
         detected_format = self.detect_format(file_path)
 
         return {
@@ -276,22 +330,13 @@ class PandocParser(BaseParser):
         """
         Check if this parser can handle the given file.
 
+        Only the extension is checked, so registry dispatch never opens
+        the file.
+
         :param file_path: Path to the file
         :return: True if the file can be parsed
         """
-        file_path = Path(file_path)
-        extension = file_path.suffix.lower()
-
-        # Check if format is in our supported list
-        if extension in self.default_config["supported_formats"]:
-            return True
-
-        # Also check if Pandoc can handle it
-        try:
-            info = self.get_conversion_info(file_path)
-            return info["is_supported"]
-        except Exception:
-            return False
+        return Path(file_path).suffix.lower() in self._supported_set
 
     def parse(self, file_path: Union[str, Path]) -> ParserResult:
         """
@@ -309,8 +354,11 @@ class PandocParser(BaseParser):
         self.logger.info(f"Parsing document with Pandoc: {file_path}")
 
         try:
+            # Stat once; the conversion info and metadata reuse the result
+            stat_result = self.validate_file(file_path)
+
             # Get conversion info
-            conversion_info = self.get_conversion_info(file_path)
+            conversion_info = self.get_conversion_info(file_path, stat_result)
 
             # Convert to markdown
             content = self.convert_file(
@@ -320,7 +368,7 @@ class PandocParser(BaseParser):
             )
 
             # Extract metadata
-            metadata = self._extract_metadata(file_path, conversion_info)
+            metadata = self._extract_metadata(file_path, conversion_info, stat_result)
 
             self.logger.info(f"Successfully parsed {file_path} with Pandoc")
 
@@ -333,38 +381,48 @@ class PandocParser(BaseParser):
             raise ParserError(f"Failed to parse document {file_path}: {e}")
 
     def _extract_metadata(
-        self, file_path: Path, conversion_info: Dict[str, Any]
+        self,
+        file_path: Path,
+        conversion_info: Dict[str, Any],
+        stat_result: Optional[os.stat_result] = None,
     ) -> Dict[str, Any]:
         """
         Extract metadata from the file and conversion info.
 
         :param file_path: Path to the file
         :param conversion_info: Information from Pandoc engine
+        :param stat_result: Stat result from :meth:`validate_file`, if available
         :return: Dictionary of metadata
         """
+        if stat_result is None:
+            stat_result = file_path.stat()
+
         metadata = {
             "parser": "pandoc",
             "file_path": str(file_path),
-            "file_size": file_path.stat().st_size,
+            "file_size": stat_result.st_size,
             "format": conversion_info["detected_format"],
             "pandoc_supported": conversion_info["is_supported"],
             "supported_formats": conversion_info["supported_formats"],
         }
 
         # Add basic file metadata
-        basic_metadata = self._extract_basic_metadata(file_path)
+        basic_metadata = self._extract_basic_metadata(file_path, stat_result)
         metadata.update(basic_metadata)
 
         return metadata
 
-    def _extract_basic_metadata(self, file_path: Path) -> Dict[str, Any]:
+    def _extract_basic_metadata(
+        self, file_path: Path, stat_result: Optional[os.stat_result] = None
+    ) -> Dict[str, Any]:
         """
         Extract basic file metadata.
 
         :param file_path: Path to the file
+        :param stat_result: Stat result for the file, if already available
         :return: Dictionary of basic metadata
         """
-        stat = file_path.stat()
+        stat = stat_result if stat_result is not None else file_path.stat()
         return {
             "file_name": file_path.name,
             "file_extension": file_path.suffix.lower(),
@@ -394,3 +452,25 @@ class PandocParser(BaseParser):
             "dependencies": {"pandoc": self.pandoc_available, "pypandoc": True},
             "config": self.default_config,
         }
+
+
+@functools.lru_cache(maxsize=32)
+def _extra_args(option_items: Tuple[Tuple[str, type, Any], ...]) -> Tuple[str, ...]:
+    """
+    Build pandoc command line arguments, cached per set of options.
+
+    :param option_items: ``(option, type, value)`` triples in command line order
+    :return: Tuple of command line arguments
+    """
+    args = []
+
+    for key, _, value in option_items:
+        if value is True:
+            args.append(f"--{key}")
+        elif value is False:
+            # For boolean false values, use the =false syntax
+            args.append(f"--{key}=false")
+        elif value is not None:
+            args.extend([f"--{key}", str(value)])
+
+    return tuple(args)
@@ -5,13 +5,67 @@ This module provides specialized parsing for PDF documents (.pdf)
 using pdfplumber as the primary processor and PyMuPDF as a fallback.
 """
 
+import functools
+import hashlib
 import logging
+import os
 import re
+import tempfile
+import threading
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union, Tuple
 
 from ..core.exceptions import ParserError, UnsupportedFormatError
-from .base import BaseParser, ParserResult
+from .base import BaseParser, ParserResult, SpooledParserResult
+
+# Missing backends are reported by PDFParser._validate_dependencies
+try:
+    import pdfplumber
+except ImportError:
+    pdfplumber = None
+
+try:
+    import pymupdf as fitz
+except ImportError:
+    try:
+        import fitz  # PyMuPDF before 1.24.3
+    except ImportError:
+        fitz = None
+
+# PyMuPDF is not thread-safe. A race-mode parse returns while the losing
+# backend is still running, so in-process PyMuPDF work is serialized
+_PYMUPDF_LOCK = threading.Lock()
+
+# PDF header; readers accept it anywhere in the first kilobyte of the file
+_PDF_SIGNATURE = b"%PDF-"
+_SIGNATURE_SEARCH_BYTES = 1024
+
+# Common document metadata fields kept by _extract_pdf_metadata
+_METADATA_FIELDS = (
+    "title",
+    "author",
+    "subject",
+    "creator",
+    "producer",
+    "creationDate",
+    "modDate",
+    "keywords",
+)
+
+# (content parts, table dicts, image dicts) extracted from one page
+PageResult = Tuple[List[str], List[Dict[str, Any]], List[Dict[str, Any]]]
+
+# Sort keys for table detection: text blocks by Y, (x, text) cells by X
+_block_y = itemgetter("y")
+_cell_x = itemgetter(0)
 
 
 class PDFParser(BaseParser):
@@ -68,6 +122,29 @@ class PDFParser(BaseParser):
             # Performance settings
             "max_pages_per_batch": 10,
             "memory_limit_mb": 512,
+            # Threads extracting pdfplumber pages (opt-in; 1 extracts pages
+            # sequentially). pdfminer holds the GIL, so threads do not speed
+            # up extraction, and each one opens its own copy of the document
+            "threads": 1,
+            # With threads set, documents with at most this many pages are
+            # still extracted sequentially
+            "parallel_min_pages": 10,
+            # Documents with more pages are split into ranges of
+            # process_chunk_pages and extracted in worker processes, by both
+            # backends: pdfplumber is mostly pure Python, so threads share the
+            # GIL, and PyMuPDF does not support multithreading at all
+            "process_min_pages": 1000,
+            "process_chunk_pages": 500,
+            "processes": None,  # Defaults to CPU count minus one
+            # Markdown output beyond this many characters is spooled to disk
+            "spool_max_size": 64 * 1024 * 1024,
+            # Run both backends at once and keep the first successful result
+            # instead of falling back sequentially; which backend wins, and
+            # so the exact output, depends on timing
+            "race_backends": False,
+            # Directory for cached results, keyed by file content so renamed
+            # and duplicate files hit the cache too (None disables caching)
+            "cache_dir": None,
         }
 
         # Merge with user config
@@ -76,18 +153,12 @@ class PDFParser(BaseParser):
 
     def _validate_dependencies(self) -> None:
         """Validate that required dependencies are available."""
-        try:
-            import pdfplumber
-            self.pdfplumber_available = True
-        except ImportError:
-            self.pdfplumber_available = False
+        self.pdfplumber_available = pdfplumber is not None
+        if not self.pdfplumber_available:
             self.logger.warning("pdfplumber not available, will use PyMuPDF fallback")
 
-        try:
-            import fitz  # PyMuPDF
-            self.pymupdf_available = True
-        except ImportError:
-            self.pymupdf_available = False
+        self.pymupdf_available = fitz is not None
+        if not self.pymupdf_available:
             self.logger.warning("PyMuPDF not available")
 
         if not self.pdfplumber_available and not self.pymupdf_available:
@@ -103,6 +174,23 @@ class PDFParser(BaseParser):
         file_path = Path(file_path)
         return file_path.suffix.lower() == ".pdf"
 
+    def can_parse_content(self, file_path: Union[str, Path]) -> bool:
+        """
+        Check whether a file starts with a PDF header.
+
+        Reads at most the first kilobyte, so non-PDF files are rejected
+        before either backend starts parsing them.
+
+        :param file_path: Path to the file
+        :return: True if the file has a PDF header
+        """
+        try:
+            with open(file_path, "rb") as f:
+                head = f.read(_SIGNATURE_SEARCH_BYTES)
+        except OSError:
+            return False
+        return _PDF_SIGNATURE in head
+
     def parse(self, file_path: Union[str, Path]) -> ParserResult:
         """
         Parse a PDF document and extract its content.
@@ -116,160 +204,453 @@ class PDFParser(BaseParser):
         if not self.can_parse(file_path):
             raise UnsupportedFormatError(f"Cannot parse {file_path.suffix} files")
 
-        self.logger.info(f"Parsing PDF document: {file_path}")
+        # Stat once; both backends reuse the result for their metadata
+        stat_result = self.validate_file(file_path)
+
+        if not self.can_parse_content(file_path):
+            raise ParserError(f"Not a PDF document (no %PDF- header): {file_path}")
 
         try:
-            # Try pdfplumber first (preferred for text and tables)
-            if self.default_config["use_pdfplumber"] and self.pdfplumber_available:
-                try:
-                    return self._parse_with_pdfplumber(file_path)
-                except Exception as e:
-                    self.logger.warning(
-                        f"pdfplumber parsing failed: {e}, trying PyMuPDF"
-                    )
+            cache_file = self._cache_file(file_path)
+            if cache_file is not None:
+                cached = self._load_cached_result(cache_file)
+                if cached is not None:
+                    self.logger.debug(f"Using cached result for {file_path}")
+                    # The entry may come from an identical file elsewhere
+                    cached.metadata["file_path"] = str(file_path)
+                    return cached
+
+            self.logger.info(f"Parsing PDF document: {file_path}")
+
+            result = self._parse_file(file_path, stat_result)
 
-            # Fallback to PyMuPDF
-            if self.default_config["use_pymupdf"] and self.pymupdf_available:
-                return self._parse_with_pymupdf(file_path)
+            if cache_file is not None:
+                self._store_cached_result(cache_file, result)
 
-            raise ParserError("No available PDF parser found")
+            return result
 
         except Exception as e:
             self.logger.error(f"PDF parsing failed for {file_path}: {e}")
             raise ParserError(f"Failed to parse PDF document {file_path}: {e}")
 
-    def _parse_with_pdfplumber(self, file_path: Path) -> ParserResult:
+    def _parse_file(self, file_path: Path, stat_result: os.stat_result) -> ParserResult:
+        """
+        Parse a PDF document with the configured backends.
+
+        :param file_path: Path to the PDF document
+        :param stat_result: Stat result from :meth:`validate_file`
+        :return: ParserResult with extracted content and metadata
+        :raises: ParserError if no backend is available
+        """
+        use_pdfplumber = (
+            self.default_config["use_pdfplumber"] and self.pdfplumber_available
+        )
+        use_pymupdf = self.default_config["use_pymupdf"] and self.pymupdf_available
+
+        if self.default_config["race_backends"] and use_pdfplumber and use_pymupdf:
+            return self._race_backends(file_path, stat_result)
+
+        # Try pdfplumber first (preferred for text and tables)
+        if use_pdfplumber:
+            try:
+                return self._parse_with_pdfplumber(file_path, stat_result)
+            except Exception as e:
+                self.logger.warning(f"pdfplumber parsing failed: {e}, trying PyMuPDF")
+
+        # Fallback to PyMuPDF
+        if use_pymupdf:
+            return self._parse_with_pymupdf(file_path, stat_result)
+
+        raise ParserError("No available PDF parser found")
+
+    def _race_backends(
+        self, file_path: Path, stat_result: os.stat_result
+    ) -> ParserResult:
+        """
+        Parse with pdfplumber and PyMuPDF concurrently.
+
+        The first backend to succeed wins; if it fails, the other one's
+        result is awaited. A running backend cannot be interrupted: the
+        loser keeps running in the background after this method returns,
+        holding its thread and open document until it finishes, and any
+        spooled result it then produces is closed. A later parse that needs
+        PyMuPDF waits on ``_PYMUPDF_LOCK`` until an abandoned PyMuPDF run
+        has finished.
+
+        :param file_path: Path to the PDF document
+        :param stat_result: Stat result from :meth:`validate_file`
+        :return: ParserResult of the first backend to succeed
+        :raises: The last backend's exception if both fail
+        """
+        executor = ThreadPoolExecutor(max_workers=2)
+        # Listed in order of preference for backends that finish together
+        futures = [
+            executor.submit(self._parse_with_pdfplumber, file_path, stat_result),
+            executor.submit(self._parse_with_pymupdf, file_path, stat_result),
+        ]
+        names = dict(zip(futures, ("pdfplumber", "PyMuPDF")))
+
+        winner = None
+        try:
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=futures.index):
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        self.logger.warning(f"{names[future]} parsing failed: {e}")
+                        error = e
+                    else:
+                        winner = future
+                        return result
+            raise error
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            for future in futures:
+                if future is not winner:
+                    future.add_done_callback(_close_discarded_result)
+
+    def _cache_file(self, file_path: Path) -> Optional[Path]:
+        """
+        Get the result cache entry for a file, if caching is enabled.
+
+        The key covers the SHA-256 of the file's bytes as well as the package
+        version and parser config, so an edited file or a changed option
+        never returns a stale result, while copies of a file share an entry.
+
+        :param file_path: Path to the PDF document
+        :return: Path of the cache entry, or None if caching is disabled
+        """
+        cache_dir = self.default_config["cache_dir"]
+        if not cache_dir:
+            return None
+
+        from .. import __version__
+
+        with open(file_path, "rb") as f:
+            digest = hashlib.file_digest(f, "sha256").hexdigest()
+
+        key_source = "|".join(
+            [digest, __version__, repr(sorted(self.default_config.items()))]
+        )
+        key = hashlib.blake2b(key_source.encode(), digest_size=16).hexdigest()
+        return Path(cache_dir).expanduser() / f"{key}.pkl"
+
+    def _parse_with_pdfplumber(
+        self, file_path: Path, stat_result: Optional[os.stat_result] = None
+    ) -> ParserResult:
         """
         Parse PDF document using pdfplumber.
 
         :param file_path: Path to the PDF document
+        :param stat_result: Stat result from :meth:`validate_file`, if available
         :return: ParserResult with extracted content
         """
-        import pdfplumber
-
         self.logger.debug(f"Using pdfplumber to parse {file_path}")
 
-        content_parts = []
-        tables = []
-        images = []
         metadata = {
             "parser": "pdfplumber",
             "file_path": str(file_path),
-            "file_size": file_path.stat().st_size,
+            "file_size": (stat_result or file_path.stat()).st_size,
             "format": "pdf",
         }
 
         # Open PDF and extract content
         with pdfplumber.open(file_path) as pdf:
-            metadata["page_count"] = len(pdf.pages)
+            page_count = len(pdf.pages)
+            metadata["page_count"] = page_count
             
             # Extract document metadata
             if hasattr(pdf, 'metadata') and pdf.metadata:
                 metadata.update(self._extract_pdf_metadata(pdf.metadata))
 
-            for page_num, page in enumerate(pdf.pages, 1):
-                self.logger.debug(f"Processing page {page_num}")
-
-                # Extract text
-                text = page.extract_text()
-                if text and text.strip():
-                    content_parts.append(f"## Page {page_num}")
-                    content_parts.append(text.strip())
-                    content_parts.append("")  # Add blank line
-
-                # Extract tables if enabled
-                if self.default_config["extract_tables"]:
-                    page_tables = page.extract_tables()
-                    for table_num, table in enumerate(page_tables, 1):
-                        if table:
-                            table_markdown = self._convert_table_to_markdown(table)
-                            if table_markdown:
-                                content_parts.append(
-                                    f"### Table {table_num} (Page {page_num})"
-                                )
-                                content_parts.append(table_markdown)
-                                content_parts.append("")  # Add blank line
-                                tables.append(
-                                    {
-                                        "page": page_num,
-                                        "table_num": table_num,
-                                        "content": table_markdown,
-                                    }
-                                )
-
-                # Extract images if enabled
-                if self.default_config["extract_images"]:
-                    page_images = self._extract_images_from_page(page, page_num)
-                    images.extend(page_images)
-
-        # Combine all content
-        content = "\n".join(content_parts)
+            processes = self._page_processes(page_count)
+            workers = self._page_workers(page_count)
+            if processes > 1:
+                page_results = self._process_pages_in_processes(
+                    _parse_pdfplumber_page_range, file_path, page_count, processes
+                )
+            elif workers > 1:
+                page_results = self._process_pdfplumber_pages_threaded(
+                    file_path, page_count, workers
+                )
+            else:
+                page_results = (
+                    self._process_pdfplumber_page(page, page_num)
+                    for page_num, page in enumerate(pdf.pages, 1)
+                )
+
+            return self._build_result(metadata, page_results)
+
+    def _process_pdfplumber_page(self, page, page_num: int) -> PageResult:
+        """
+        Extract the text, tables and images of one page using pdfplumber.
 
-        # Add metadata
-        if tables:
-            metadata["tables"] = tables
-        if images:
-            metadata["images"] = images
+        :param page: pdfplumber page object
+        :param page_num: Page number
+        :return: Content parts, tables and images of the page
+        """
+        content_parts = []
+        tables = []
+        images = []
 
-        return ParserResult(
-            content=content, metadata=metadata, format="markdown", messages=[]
-        )
+        self.logger.debug("Processing page %d", page_num)
+
+        # The page is parsed once here and its objects are cached for the
+        # extraction below. Scanned or image-only pages have no characters,
+        # so there is no text to lay out and no table cell to fill.
+        has_text = bool(page.chars)
+
+        # Extract text
+        text = (page.extract_text() or "").strip() if has_text else ""
+        if text:
+            content_parts.append(f"## Page {page_num}")
+            content_parts.append(text)
+            content_parts.append("")  # Add blank line
+
+        # Extract tables if enabled
+        if has_text and self.default_config["extract_tables"]:
+            page_tables = page.extract_tables()
+            for table_num, table in enumerate(page_tables, 1):
+                if table:
+                    table_markdown = self._convert_table_to_markdown(table)
+                    if table_markdown:
+                        content_parts.append(f"### Table {table_num} (Page {page_num})")
+                        content_parts.append(table_markdown)
+                        content_parts.append("")  # Add blank line
+                        tables.append(
+                            {
+                                "page": page_num,
+                                "table_num": table_num,
+                                "content": table_markdown,
+                            }
+                        )
+
+        # Extract images if enabled
+        if self.default_config["extract_images"]:
+            page_images = self._extract_images_from_page(page, page_num)
+            images.extend(page_images)
+
+        # Drop the page's parsed objects and text map; the open document
+        # otherwise keeps them for every page visited
+        page.close()
+
+        return content_parts, tables, images
+
+    def _process_pdfplumber_pages_threaded(
+        self, file_path: Path, page_count: int, workers: int
+    ) -> Iterator[PageResult]:
+        """
+        Extract all pages on a thread pool, yielding results in page order.
+
+        A pdfplumber document shares one file handle and parser state between
+        its pages, so it is not safe to use from several threads. Each worker
+        opens the file once and keeps it in thread-local storage instead.
+
+        :param file_path: Path to the PDF document
+        :param page_count: Number of pages in the document
+        :param workers: Number of worker threads
+        :return: Iterator of per-page results in page order
+        """
+        self.logger.debug(f"Extracting {page_count} pages with {workers} threads")
+        local = threading.local()
+        opened = []
+
+        def process_page(page_num: int) -> PageResult:
+            pdf = getattr(local, "pdf", None)
+            if pdf is None:
+                pdf = local.pdf = pdfplumber.open(file_path)
+                opened.append(pdf)
+            return self._process_pdfplumber_page(pdf.pages[page_num - 1], page_num)
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                yield from executor.map(process_page, range(1, page_count + 1))
+        finally:
+            for pdf in opened:
+                pdf.close()
+
+    def _process_pages_in_processes(
+        self,
+        parse_range: Callable[..., List[PageResult]],
+        file_path: Path,
+        page_count: int,
+        processes: int,
+    ) -> Iterator[PageResult]:
+        """
+        Extract page ranges in worker processes, yielding results in page order.
+
+        Each worker reopens the PDF from its path and extracts only its range,
+        so no document or page objects are pickled.
+
+        :param parse_range: Module-level function extracting one page range
+        :param file_path: Path to the PDF document
+        :param page_count: Number of pages in the document
+        :param processes: Number of worker processes
+        :return: Iterator of per-page results in page order
+        """
+        chunk = self.default_config["process_chunk_pages"]
+        self.logger.debug(f"Extracting {page_count} pages with {processes} processes")
+
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [
+                executor.submit(
+                    parse_range,
+                    file_path,
+                    start,
+                    min(start + chunk, page_count + 1),
+                    self.default_config,
+                )
+                for start in range(1, page_count + 1, chunk)
+            ]
+            for future in futures:
+                yield from future.result()
+
+    def _page_processes(self, page_count: int) -> int:
+        """
+        Get the number of processes to extract a document's pages with.
+
+        :param page_count: Number of pages in the document
+        :return: Number of worker processes, 1 to stay in-process
+        """
+        if page_count <= self.default_config["process_min_pages"]:
+            return 1
+
+        chunks = -(-page_count // self.default_config["process_chunk_pages"])
+        processes = self.default_config["processes"] or (os.cpu_count() or 1) - 1
+        return max(1, min(chunks, processes))
 
-    def _parse_with_pymupdf(self, file_path: Path) -> ParserResult:
+    def _page_workers(self, page_count: int) -> int:
+        """
+        Get the number of threads to extract a document's pages with.
+
+        Pages are extracted sequentially unless ``threads`` is set above 1;
+        even then, short documents are extracted sequentially and longer ones
+        use up to one thread per page.
+
+        :param page_count: Number of pages in the document
+        :return: Number of worker threads, 1 for sequential extraction
+        """
+        threads = self.default_config["threads"] or 1
+        if threads <= 1 or page_count <= self.default_config["parallel_min_pages"]:
+            return 1
+
+        return min(page_count, threads)
+
+    def _parse_with_pymupdf(
+        self, file_path: Path, stat_result: Optional[os.stat_result] = None
+    ) -> ParserResult:
         """
         Parse PDF document using PyMuPDF.
 
         :param file_path: Path to the PDF document
+        :param stat_result: Stat result from :meth:`validate_file`, if available
         :return: ParserResult with extracted content
         """
-        import fitz  # PyMuPDF
-
         self.logger.debug(f"Using PyMuPDF to parse {file_path}")
 
-        content_parts = []
-        tables = []
-        images = []
         metadata = {
             "parser": "pymupdf",
             "file_path": str(file_path),
-            "file_size": file_path.stat().st_size,
+            "file_size": (stat_result or file_path.stat()).st_size,
             "format": "pdf",
         }
 
-        # Open PDF and extract content
-        doc = fitz.open(file_path)
-        metadata["page_count"] = len(doc)
-
-        # Extract document metadata
-        doc_metadata = doc.metadata
-        if doc_metadata:
-            metadata.update(self._extract_pdf_metadata(doc_metadata))
-
-        for page_num in range(len(doc)):
-            page = doc.load_page(page_num)
-
-            # Extract text
-            text = page.get_text()
-            if text and text.strip():
-                if self.default_config["preserve_page_breaks"]:
-                    content_parts.append(f"## Page {page_num + 1}")
-                content_parts.append(text.strip())
-                content_parts.append("")  # Add blank line
-
-            # Extract tables using PyMuPDF
-            if self.default_config["extract_tables"]:
-                page_tables = self._extract_tables_pymupdf(page, page_num + 1)
-                tables.extend(page_tables)
+        # Open PDF and extract content; one document at a time, see
+        # _PYMUPDF_LOCK
+        with _PYMUPDF_LOCK:
+            doc = fitz.open(file_path)
+            metadata["page_count"] = len(doc)
 
-            # Extract images
-            if self.default_config["extract_images"]:
-                page_images = self._extract_images_pymupdf(page, page_num + 1)
-                images.extend(page_images)
+            # Extract document metadata
+            doc_metadata = doc.metadata
+            if doc_metadata:
+                metadata.update(self._extract_pdf_metadata(doc_metadata))
+
+            try:
+                processes = self._page_processes(len(doc))
+                if processes > 1:
+                    page_results = self._process_pages_in_processes(
+                        _parse_pymupdf_page_range, file_path, len(doc), processes
+                    )
+                else:
+                    page_results = (
+                        self._process_pymupdf_page(page, page_num)
+                        for page_num, page in enumerate(doc, 1)
+                    )
+                return self._build_result(metadata, page_results)
+            finally:
+                doc.close()
 
-        doc.close()
+    def _process_pymupdf_page(self, page, page_num: int) -> PageResult:
+        """
+        Extract the text, tables and images of one page using PyMuPDF.
 
-        # Combine all content
-        content = "\n".join(content_parts)
+        :param page: PyMuPDF page object
+        :param page_num: Page number
+        :return: Content parts, tables and images of the page
+        """
+        content_parts = []
+        tables = []
+        images = []
+
+        # Extract text
+        text = page.get_text().strip()
+        if text:
+            if self.default_config["preserve_page_breaks"]:
+                content_parts.append(f"## Page {page_num}")
+            content_parts.append(text)
+            content_parts.append("")  # Add blank line
+
+        # Extract tables using PyMuPDF
+        if self.default_config["extract_tables"]:
+            page_tables = self._extract_tables_pymupdf(page, page_num)
+            tables.extend(page_tables)
+
+        # Extract images
+        if self.default_config["extract_images"]:
+            page_images = self._extract_images_pymupdf(page, page_num)
+            images.extend(page_images)
+
+        return content_parts, tables, images
+
+    def _build_result(
+        self, metadata: Dict[str, Any], page_results: Iterable[PageResult]
+    ) -> ParserResult:
+        """
+        Write per-page results to a spool as they are extracted.
+
+        Only one page's content parts are held at a time; the document's
+        markdown stays in memory up to spool_max_size and on disk beyond it.
+
+        :param metadata: Backend metadata to extend
+        :param page_results: Per-page results in page order
+        :return: ParserResult with extracted content
+        """
+        spool = tempfile.SpooledTemporaryFile(
+            max_size=self.default_config["spool_max_size"],
+            mode="w+",
+            encoding="utf-8",
+            newline="",
+        )
+        written = False
+        tables = []
+        images = []
+
+        try:
+            for page_parts, page_tables, page_images in page_results:
+                if page_parts:
+                    # Parts are newline-separated across page boundaries too
+                    if written:
+                        spool.write("\n")
+                    spool.write("\n".join(page_parts))
+                    written = True
+                tables.extend(page_tables)
+                images.extend(page_images)
+        except BaseException:
+            spool.close()
+            raise
 
         # Add metadata
         if tables:
@@ -277,8 +658,8 @@ class PDFParser(BaseParser):
         if images:
             metadata["images"] = images
 
-        return ParserResult(
-            content=content, metadata=metadata, format="markdown", messages=[]
+        return SpooledParserResult(
+            spool, metadata=metadata, format="markdown", messages=[]
         )
 
     def _extract_images_from_page(self, page, page_num: int) -> List[Dict]:
@@ -311,9 +692,13 @@ class PDFParser(BaseParser):
         tables = []
         
         try:
-            # PyMuPDF doesn't have built-in table extraction
-            # We'll use a simple approach based on text positioning
-            text_dict = page.get_text("dict")
+            # PyMuPDF's page.find_tables() is a pure-Python port of
+            # pdfplumber's table finder and 20-30x slower than this fallback
+            # needs to be, so use a simple approach based on text positioning.
+            # Image blocks carry no lines, so skip decoding them into the dict.
+            text_dict = page.get_text(
+                "dict", flags=fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
+            )
             
             if "blocks" in text_dict:
                 # Group text by vertical position to identify potential tables
@@ -348,7 +733,6 @@ class PDFParser(BaseParser):
         images = []
         
         try:
-            import fitz  # PyMuPDF
             image_list = page.get_images()
             
             for img_index, img in enumerate(image_list):
@@ -363,7 +747,9 @@ class PDFParser(BaseParser):
                             "width": pix.width,
                             "height": pix.height,
                             "colorspace": pix.colorspace.name if pix.colorspace else "unknown",
-                            "size_bytes": len(pix.tobytes()),
+                            # Decoded pixel data; encoding a PNG just to
+                            # measure it would cost far more than the lookup
+                            "size_bytes": pix.width * pix.height * pix.n,
                         }
                         images.append(img_data)
                     
@@ -388,42 +774,52 @@ class PDFParser(BaseParser):
         tables = []
         
         try:
-            # Group text by similar Y positions (rows)
+            # Group text by similar Y positions (rows): sweep the blocks in Y
+            # order, starting a new row once a block is more than y_tolerance
+            # below the first block of the current row
             y_tolerance = 5
-            rows = {}
-            
-            for block in text_blocks:
-                y_key = round(block["y"] / y_tolerance) * y_tolerance
-                if y_key not in rows:
-                    rows[y_key] = []
-                rows[y_key].append(block)
-            
-            # Sort rows by Y position
-            sorted_rows = sorted(rows.items(), key=lambda x: x[0])
-            
+            table_data = []
+            row = []  # (x, text) cells of the current row
+            row_y = None
+
+            for block in sorted(text_blocks, key=_block_y):
+                y = block["y"]
+                if row and y - row_y > y_tolerance:
+                    table_data.append(self._row_text(row))
+                    row = []
+                if not row:
+                    row_y = y
+                row.append((block["bbox"][0], block["text"]))
+
+            if row:
+                table_data.append(self._row_text(row))
+
             # Convert to table format
-            if len(sorted_rows) > 1:  # At least 2 rows for a table
-                table_data = []
-                for _, row_blocks in sorted_rows:
-                    # Sort blocks in row by X position
-                    row_blocks.sort(key=lambda b: b["bbox"][0])
-                    row = [block["text"] for block in row_blocks]
-                    table_data.append(row)
-                
-                if table_data:
-                    table_markdown = self._convert_table_to_markdown(table_data)
-                    tables.append({
-                        "page": page_num,
-                        "table_num": len(tables) + 1,
-                        "content": table_markdown,
-                        "detection_method": "text_positioning"
-                    })
-                    
+            if len(table_data) > 1:  # At least 2 rows for a table
+                table_markdown = self._convert_table_to_markdown(table_data)
+                tables.append({
+                    "page": page_num,
+                    "table_num": len(tables) + 1,
+                    "content": table_markdown,
+                    "detection_method": "text_positioning"
+                })
+
         except Exception as e:
             self.logger.warning(f"Table detection failed: {e}")
             
         return tables
 
+    @staticmethod
+    def _row_text(row: List[Tuple[float, str]]) -> List[str]:
+        """
+        Get the texts of one detected row's cells in X order.
+
+        :param row: ``(x, text)`` pairs of the row's text blocks
+        :return: List of cell texts
+        """
+        row.sort(key=_cell_x)
+        return [text for _, text in row]
+
     def _extract_pdf_metadata(self, metadata: Dict) -> Dict:
         """
         Extract and clean PDF metadata.
@@ -432,20 +828,15 @@ class PDFParser(BaseParser):
         :return: Cleaned metadata dictionary
         """
         cleaned_metadata = {}
-        
-        # Common metadata fields
-        metadata_fields = [
-            "title", "author", "subject", "creator", "producer",
-            "creationDate", "modDate", "keywords"
-        ]
-        
-        for field in metadata_fields:
-            if field in metadata and metadata[field]:
+
+        for field in _METADATA_FIELDS:
+            value = metadata.get(field)
+            if value:
                 # Clean the value
-                value = str(metadata[field]).strip()
+                value = str(value).strip()
                 if value and value != "null":
                     cleaned_metadata[field] = value
-        
+
         return cleaned_metadata
 
     def _convert_table_to_markdown(self, table: List[List[str]]) -> str:
@@ -458,29 +849,21 @@ class PDFParser(BaseParser):
         if not table or not table[0]:
             return ""
 
-        markdown_lines = []
+        lines = []
 
-        # Process each row
-        for i, row in enumerate(table):
-            # Clean and escape cell content
-            cells = []
-            for cell in row:
-                if cell is None:
-                    cell_text = ""
-                else:
-                    cell_text = str(cell).strip().replace("|", "\\|")
-                cells.append(cell_text)
-
-            # Create markdown row
-            markdown_row = "| " + " | ".join(cells) + " |"
-            markdown_lines.append(markdown_row)
+        # Process each row, cleaning and escaping cell content
+        for row in table:
+            cells = [
+                "" if cell is None else str(cell).strip().replace("|", "\\|")
+                for cell in row
+            ]
+            lines.append(" | ".join(cells))
 
-            # Add separator row after header
-            if i == 0:
-                separator = "| " + " | ".join(["---"] * len(cells)) + " |"
-                markdown_lines.append(separator)
+        # Add separator row after header
+        lines.insert(1, _separator_cells(len(table[0])))
 
-        return "\n".join(markdown_lines)
+        # Pipes around and between rows are added in one final join
+        return "| " + " |\n| ".join(lines) + " |"
 
     def get_supported_formats(self) -> List[str]:
         """
@@ -506,3 +889,67 @@ class PDFParser(BaseParser):
             },
             "config": self.default_config,
         }
+
+
+def _parse_pdfplumber_page_range(
+    file_path: Path, start: int, end: int, config: Dict[str, Any]
+) -> List[PageResult]:
+    """
+    Extract a range of pages with pdfplumber; used by worker processes.
+
+    :param file_path: Path to the PDF document
+    :param start: First page number of the range
+    :param end: Page number after the last page of the range
+    :param config: Configuration dictionary for the parser
+    :return: Per-page results in page order
+    """
+    parser = PDFParser(config)
+    with pdfplumber.open(file_path, pages=range(start, end)) as pdf:
+        return [
+            parser._process_pdfplumber_page(page, page.page_number)
+            for page in pdf.pages
+        ]
+
+
+def _parse_pymupdf_page_range(
+    file_path: Path, start: int, end: int, config: Dict[str, Any]
+) -> List[PageResult]:
+    """
+    Extract a range of pages with PyMuPDF; used by worker processes.
+
+    :param file_path: Path to the PDF document
+    :param start: First page number of the range
+    :param end: Page number after the last page of the range
+    :param config: Configuration dictionary for the parser
+    :return: Per-page results in page order
+    """
+    parser = PDFParser(config)
+    with fitz.open(file_path) as doc:
+        return [
+            parser._process_pymupdf_page(doc.load_page(page_num - 1), page_num)
+            for page_num in range(start, end)
+        ]
+
+
+def _close_discarded_result(future: Future) -> None:
+    """
+    Close the spooled result of a backend that lost the race.
+
+    :param future: Finished future of the losing backend
+    """
+    if future.cancelled() or future.exception() is not None:
+        return
+    result = future.result()
+    if isinstance(result, SpooledParserResult):
+        result.close()
+
+
+@functools.lru_cache(maxsize=128)
+def _separator_cells(column_count: int) -> str:
+    """
+    Build the inner cells of the markdown separator row for a table.
+
+    :param column_count: Number of table columns
+    :return: Separator cells, e.g. ``--- | ---``
+    """
+    return " | ".join(["---"] * column_count)
@@ -5,13 +5,75 @@ This module provides specialized parsing for Word documents (.docx, .doc)
 using mammoth as the primary processor and python-docx as a fallback.
 """
 
+import functools
+import hashlib
+import io
 import logging
+import os
+import xml.etree.ElementTree as ElementTree
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from ..core.exceptions import ParserError, UnsupportedFormatError
 from .base import BaseParser, ParserResult
 
+try:
+    import mammoth
+except ImportError:  # Reported by WordParser._validate_dependencies
+    mammoth = None
+
+try:
+    import docx
+    from docx.opc.coreprops import CoreProperties
+    from docx.oxml import parse_xml
+    from docx.table import Table
+except ImportError:  # Reported by WordParser._validate_dependencies
+    docx = None
+
+try:
+    from lxml import etree
+except ImportError:  # The streaming reader uses xml.etree without lxml
+    etree = None
+
+# WordprocessingML element and attribute names
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_BODY = f"{_W}body"
+_W_P = f"{_W}p"
+_W_R = f"{_W}r"
+_W_T = f"{_W}t"
+_W_BR = f"{_W}br"
+_W_HYPERLINK = f"{_W}hyperlink"
+_W_TBL = f"{_W}tbl"
+_W_TR = f"{_W}tr"
+_W_TC = f"{_W}tc"
+_W_SECT_PR = f"{_W}sectPr"
+_W_STYLE = f"{_W}style"
+_W_VAL = f"{_W}val"
+_W_TYPE = f"{_W}type"
+_W_DEFAULT = f"{_W}default"
+_W_STYLE_ID = f"{_W}styleId"
+_P_STYLE_PATH = f"{_W}pPr/{_W}pStyle"
+_P_SECT_PR_PATH = f"{_W}pPr/{_W_SECT_PR}"
+_GRID_BEFORE_PATH = f"{_W}trPr/{_W}gridBefore"
+_GRID_SPAN_PATH = f"{_W}tcPr/{_W}gridSpan"
+_V_MERGE_PATH = f"{_W}tcPr/{_W}vMerge"
+_STYLE_NAME_PATH = f"{_W}name"
+
+# .docx files are ZIP archives; anything else (binary .doc, RTF) must be
+# converted before either backend can read it
+_ZIP_SIGNATURE = b"PK\x03\x04"
+
+# Run children with a fixed text equivalent, as in python-docx's Run.text
+# (w:br is handled separately since only text-wrapping breaks count)
+_RUN_TEXT = {
+    f"{_W}tab": "\t",
+    f"{_W}ptab": "\t",
+    f"{_W}cr": "\n",
+    f"{_W}noBreakHyphen": "-",
+}
+
 
 class WordParser(BaseParser):
     """
@@ -43,6 +105,9 @@ class WordParser(BaseParser):
                 "id_prefix": "docx-",
                 "transform_document": None,
             },
+            # Larger files skip mammoth and go straight to the streaming
+            # python-docx reader (None tries mammoth at any size)
+            "mammoth_max_file_size": 5 * 1024 * 1024,  # 5MB
             # Fallback processor (python-docx)
             "use_python_docx": True,
             "python_docx_options": {
@@ -50,6 +115,14 @@ class WordParser(BaseParser):
                 "preserve_formatting": True,
                 "include_metadata": True,
             },
+            # Read word/document.xml with iterparse instead of building a
+            # python-docx Document (falls back to it on malformed XML)
+            "stream_python_docx": True,
+            # XML parser for streaming: "etree" (xml.etree) or "lxml"
+            "streaming_xml_parser": "etree",
+            # Directory for cached results, keyed by file content so renamed
+            # and duplicate files hit the cache too (None disables caching)
+            "cache_dir": None,
             # Output settings
             "extract_images": True,
             "image_dir": "images",
@@ -64,20 +137,12 @@ class WordParser(BaseParser):
 
     def _validate_dependencies(self) -> None:
         """Validate that required dependencies are available."""
-        try:
-            import mammoth
-
-            self.mammoth_available = True
-        except ImportError:
-            self.mammoth_available = False
+        self.mammoth_available = mammoth is not None
+        if not self.mammoth_available:
             self.logger.warning("mammoth not available, will use python-docx fallback")
 
-        try:
-            import docx
-
-            self.python_docx_available = True
-        except ImportError:
-            self.python_docx_available = False
+        self.python_docx_available = docx is not None
+        if not self.python_docx_available:
             self.logger.warning("python-docx not available")
 
         if not self.mammoth_available and not self.python_docx_available:
@@ -106,30 +171,155 @@ class WordParser(BaseParser):
         if not self.can_parse(file_path):
             raise UnsupportedFormatError(f"Cannot parse {file_path.suffix} files")
 
-        self.logger.info(f"Parsing Word document: {file_path}")
+        # Stat once; the size picks the backend and fills mammoth's metadata
+        stat_result = self.validate_file(file_path)
+
+        try:
+            data = file_path.read_bytes()
+
+            cache_file = self._cache_file(data)
+            if cache_file is not None:
+                cached = self._load_cached_entry(cache_file, file_path)
+                if cached is not None:
+                    return cached
+
+            self.logger.info(f"Parsing Word document: {file_path}")
+
+            result = self._parse_file(file_path, data, stat_result)
+
+            if cache_file is not None:
+                self._store_cached_result(cache_file, result)
+
+            return result
+
+        except Exception as e:
+            self.logger.error(f"Word parsing failed for {file_path}: {e}")
+            raise ParserError(f"Failed to parse Word document {file_path}: {e}")
+
+    @classmethod
+    def parse_many(
+        cls,
+        file_paths: List[Union[str, Path]],
+        config: Optional[Dict[str, Any]] = None,
+        workers: Optional[int] = None,
+    ) -> List[ParserResult]:
+        """
+        Parse several Word documents in parallel worker processes.
+
+        mammoth and python-docx run as pure Python, so documents are spread
+        over a process pool. With ``cache_dir`` set, documents already in the
+        cache are answered here and only the misses go to workers, which
+        store their results in the same cache.
+
+        :param file_paths: Paths to the Word documents
+        :param config: Configuration dictionary for the parsers
+        :param workers: Number of worker processes (defaults to CPU count)
+        :return: ParserResult per document, in input order
+        :raises: ParserError if parsing any document fails
+        """
+        parser = cls(config)
+        results: List[Optional[ParserResult]] = [None] * len(file_paths)
+
+        if parser.default_config["cache_dir"]:
+            for index, file_path in enumerate(file_paths):
+                try:
+                    cache_file = parser._cache_file(Path(file_path).read_bytes())
+                except OSError:
+                    continue  # Reported by the parse below
+                results[index] = parser._load_cached_entry(cache_file, file_path)
+
+        misses = [index for index, result in enumerate(results) if result is None]
+        parse_file = functools.partial(_parse_word_file, config=config)
+        miss_paths = [file_paths[index] for index in misses]
+
+        workers = min(len(misses), workers or os.cpu_count() or 1)
+        if workers < 2:
+            parsed = [parse_file(file_path) for file_path in miss_paths]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                parsed = list(executor.map(parse_file, miss_paths))
+
+        for index, result in zip(misses, parsed):
+            results[index] = result
+        return results
+
+    def _load_cached_entry(
+        self, cache_file: Path, file_path: Union[str, Path]
+    ) -> Optional[ParserResult]:
+        """
+        Load a cached result for a document.
+
+        :param cache_file: Path of the cache entry
+        :param file_path: Path to the Word document being parsed
+        :return: The cached result, or None on a miss
+        """
+        cached = self._load_cached_result(cache_file)
+        if cached is not None:
+            self.logger.debug(f"Using cached result for {file_path}")
+            # The entry may come from an identical file elsewhere
+            if "file_path" in cached.metadata:
+                cached.metadata["file_path"] = str(file_path)
+        return cached
+
+    def _parse_file(
+        self, file_path: Path, data: bytes, stat_result: os.stat_result
+    ) -> ParserResult:
+        """
+        Parse a Word document with the first backend that succeeds.
 
-        # Check if file needs conversion (e.g., .doc -> .docx, .rtf -> .docx)
-        converted_file = self._ensure_readable_format(file_path)
+        :param file_path: Path to the Word document
+        :param data: Contents of the file
+        :param stat_result: Stat result from :meth:`validate_file`
+        :return: ParserResult with extracted content and metadata
+        :raises: ParserError if the file is not .docx or no backend is available
+        """
+        use_python_docx = (
+            self.default_config["use_python_docx"] and self.python_docx_available
+        )
+        max_size = self.default_config["mammoth_max_file_size"]
+        use_mammoth = self.default_config["use_mammoth"] and self.mammoth_available
+        if use_mammoth and use_python_docx and max_size is not None:
+            use_mammoth = stat_result.st_size <= max_size
+
+        # Only non-ZIP content needs conversion (e.g., .doc -> .docx, .rtf ->
+        # .docx); a .doc that is really a .docx is read directly
+        if data.startswith(_ZIP_SIGNATURE):
+            converted_file = file_path
+        else:
+            converted_file = self._ensure_readable_format(file_path)
+            if converted_file == file_path:
+                # Neither backend can read a file that is not a ZIP archive
+                raise ParserError(
+                    f"Not a .docx document and it could not be converted: {file_path}"
+                )
 
         try:
+            if converted_file != file_path:
+                data = converted_file.read_bytes()
+
+            # Both backends parse the same in-memory buffer
+            source = io.BytesIO(data)
+
             # Try mammoth first (preferred)
-            if self.default_config["use_mammoth"] and self.mammoth_available:
+            if use_mammoth:
                 try:
-                    return self._parse_with_mammoth(converted_file)
+                    # The metadata of a converted file describes the copy
+                    return self._parse_with_mammoth(
+                        source,
+                        converted_file,
+                        stat_result if converted_file == file_path else None,
+                    )
                 except Exception as e:
                     self.logger.warning(
                         f"Mammoth parsing failed: {e}, trying python-docx"
                     )
 
             # Fallback to python-docx
-            if self.default_config["use_python_docx"] and self.python_docx_available:
-                return self._parse_with_python_docx(converted_file)
+            if use_python_docx:
+                return self._parse_with_python_docx(source, converted_file)
 
             raise ParserError("No available Word parser found")
 
-        except Exception as e:
-            self.logger.error(f"Word parsing failed for {file_path}: {e}")
-            raise ParserError(f"Failed to parse Word document {file_path}: {e}")
         finally:
             # Clean up converted file if it's different from original
             if converted_file != file_path and self.default_config.get(
@@ -137,23 +327,55 @@ class WordParser(BaseParser):
             ):
                 self._cleanup_converted_file(converted_file)
 
-    def _parse_with_mammoth(self, file_path: Path) -> ParserResult:
+    def _cache_file(self, data: bytes) -> Optional[Path]:
+        """
+        Get the result cache entry for a document, if caching is enabled.
+
+        The key covers the SHA-256 of the file's bytes as well as the package
+        version and parser config, so an edited file or a changed option
+        never returns a stale result, while copies of a file share an entry.
+
+        :param data: Contents of the Word document
+        :return: Path of the cache entry, or None if caching is disabled
+        """
+        cache_dir = self.default_config["cache_dir"]
+        if not cache_dir:
+            return None
+
+        from .. import __version__
+
+        key_source = "|".join(
+            [
+                hashlib.sha256(data).hexdigest(),
+                __version__,
+                repr(sorted(self.default_config.items())),
+            ]
+        )
+        key = hashlib.blake2b(key_source.encode(), digest_size=16).hexdigest()
+        return Path(cache_dir).expanduser() / f"{key}.pkl"
+
+    def _parse_with_mammoth(
+        self,
+        source: BinaryIO,
+        file_path: Path,
+        stat_result: Optional[os.stat_result] = None,
+    ) -> ParserResult:
         """
         Parse Word document using mammoth.
 
+        :param source: Seekable binary stream with the document's contents
         :param file_path: Path to the Word document
+        :param stat_result: Stat result from :meth:`validate_file`, if available
         :return: ParserResult with extracted content
         """
-        import mammoth
-
         self.logger.debug(f"Using mammoth to parse {file_path}")
 
         # Setup mammoth options
         options = self.default_config["mammoth_options"].copy()
 
         # Convert to HTML first
-        with open(file_path, "rb") as docx_file:
-            result = mammoth.convert_to_html(docx_file, options)
+        source.seek(0)
+        result = mammoth.convert_to_html(source, options)
 
         # Extract content and metadata
         content = result.value
@@ -164,7 +386,7 @@ class WordParser(BaseParser):
             self.logger.warning(f"Mammoth messages for {file_path}: {messages}")
 
         # Extract metadata
-        metadata = self._extract_metadata_mammoth(file_path)
+        metadata = self._extract_metadata_mammoth(file_path, stat_result)
 
         return ParserResult(
             content=content,
@@ -173,84 +395,267 @@ class WordParser(BaseParser):
             messages=messages,
         )
 
-    def _parse_with_python_docx(self, file_path: Path) -> ParserResult:
+    def _parse_with_python_docx(
+        self, source: BinaryIO, file_path: Path
+    ) -> ParserResult:
         """
         Parse Word document using python-docx.
 
+        :param source: Seekable binary stream with the document's contents
         :param file_path: Path to the Word document
         :return: ParserResult with extracted content
         """
-        from docx import Document
+        if self.default_config["stream_python_docx"]:
+            xml_parser = self._streaming_xml_parser()
+            try:
+                return self._parse_with_iterparse(source, file_path, xml_parser)
+            except (SyntaxError, KeyError) as e:
+                self.logger.warning(
+                    f"Streaming parse failed: {e}, loading the python-docx Document"
+                )
 
         self.logger.debug(f"Using python-docx to parse {file_path}")
 
         # Load the document
-        doc = Document(file_path)
+        source.seek(0)
+        doc = docx.Document(source)
 
-        # Extract content
-        content = self._extract_content_python_docx(doc)
+        # Extract content, counting paragraphs and tables on the way
+        content, stats = self._extract_content_python_docx(doc)
 
         # Extract metadata
-        metadata = self._extract_metadata_python_docx(doc)
+        metadata = self._extract_metadata_python_docx(doc, stats)
 
         return ParserResult(
             content=content, metadata=metadata, format="markdown", messages=[]
         )
 
-    def _extract_content_python_docx(self, doc) -> str:
+    def _streaming_xml_parser(self) -> Any:
         """
-        Extract content from python-docx document.
+        Get the ElementTree-compatible module used by the streaming reader.
 
-        :param doc: python-docx Document object
-        :return: Extracted content as markdown
+        :return: lxml.etree if configured and available, else xml.etree
+        """
+        if self.default_config["streaming_xml_parser"] == "lxml" and etree:
+            return etree
+        return ElementTree
+
+    def _parse_with_iterparse(
+        self, source: BinaryIO, file_path: Path, xml_parser: Any = ElementTree
+    ) -> ParserResult:
+        """
+        Parse Word document by streaming word/document.xml with iterparse.
+
+        Body paragraphs are converted as they end and the body is then
+        emptied, so only one body element (or table) is held in memory
+        instead of the python-docx object tree. The markdown and metadata
+        match :meth:`_extract_content_python_docx` and
+        :meth:`_extract_metadata_python_docx`.
+
+        :param source: Seekable binary stream with the document's contents
+        :param file_path: Path to the Word document
+        :param xml_parser: xml.etree.ElementTree or lxml.etree
+        :return: ParserResult with extracted content
+        :raises: SyntaxError (ParseError, XMLSyntaxError) on malformed XML
         """
+        self.logger.debug(f"Using iterparse to stream {file_path}")
+
         content_parts = []
+        counts = {"paragraph_count": 0, "table_count": 0, "section_count": 0}
+
+        source.seek(0)
+        with zipfile.ZipFile(source) as archive:
+            style_names, default_style = self._read_paragraph_styles(
+                archive, xml_parser
+            )
+
+            with archive.open("word/document.xml") as document_xml:
+                body = None
+                depth = 0  # Elements in w:body children end at depth > 2
+                for event, element in xml_parser.iterparse(
+                    document_xml, events=("start", "end")
+                ):
+                    if event == "start":
+                        depth += 1
+                        if element.tag == _W_BODY:
+                            body = element
+                        continue
+
+                    depth -= 1
+                    if body is None or depth != 2:  # Not a direct w:body child
+                        continue
+
+                    if element.tag == _W_P:
+                        counts["paragraph_count"] += 1
+                        if element.find(_P_SECT_PR_PATH) is not None:
+                            counts["section_count"] += 1
+                        text = _paragraph_text(element)
+                        if text.strip():
+                            style = element.find(_P_STYLE_PATH)
+                            if style is not None:
+                                style_name = style_names.get(
+                                    style.get(_W_VAL), default_style
+                                )
+                            else:
+                                style_name = default_style
+                            content_parts.append(
+                                self._format_paragraph(text.strip(), style_name)
+                            )
+                            content_parts.append("")  # Add blank line
+                    elif element.tag == _W_TBL:
+                        counts["table_count"] += 1
+                        content_parts.append(
+                            self._convert_table_to_markdown(_table_cell_texts(element))
+                        )
+                        content_parts.append("")  # Add blank line
+                    elif element.tag == _W_SECT_PR:
+                        counts["section_count"] += 1
+
+                    body.clear()
+
+            metadata = self._read_core_properties(archive)
+
+        metadata.update(counts)
+
+        return ParserResult(
+            content="\n".join(content_parts),
+            metadata=metadata,
+            format="markdown",
+            messages=[],
+        )
+
+    def _read_paragraph_styles(
+        self, archive: zipfile.ZipFile, xml_parser: Any = ElementTree
+    ) -> Tuple[Dict[str, str], str]:
+        """
+        Read paragraph style names from word/styles.xml.
+
+        Unknown style ids resolve to the default paragraph style, as in
+        python-docx.
 
-        # Extract paragraphs
-        for paragraph in doc.paragraphs:
-            if paragraph.text.strip():
-                # Handle different paragraph styles
-                style = paragraph.style.name.lower()
-                text = paragraph.text.strip()
-
-                if "heading" in style:
-                    level = style.replace("heading", "").strip()
-                    if level.isdigit():
-                        heading_level = int(level)
-                    else:
-                        heading_level = 1
-                    content_parts.append(f"{'#' * heading_level} {text}")
-                else:
-                    content_parts.append(text)
+        :param archive: Open .docx archive
+        :param xml_parser: xml.etree.ElementTree or lxml.etree
+        :return: Style names by style id, and the default style name
+        """
+        style_names = {}
+        default_style = "Normal"
 
+        try:
+            styles_xml = archive.open("word/styles.xml")
+        except KeyError:
+            return style_names, default_style
+
+        with styles_xml:
+            root = xml_parser.parse(styles_xml).getroot()
+
+        for style in root.findall(_W_STYLE):
+            if style.get(_W_TYPE, "paragraph") != "paragraph":
+                continue
+            name = style.find(_STYLE_NAME_PATH)
+            name = name.get(_W_VAL, "") if name is not None else ""
+            style_names[style.get(_W_STYLE_ID)] = name
+            if style.get(_W_DEFAULT) == "1":
+                default_style = name
+
+        return style_names, default_style
+
+    def _read_core_properties(self, archive: zipfile.ZipFile) -> Dict[str, Any]:
+        """
+        Read metadata from docProps/core.xml without loading the document.
+
+        :param archive: Open .docx archive
+        :return: Dictionary of metadata
+        """
+        metadata = {"parser": "python-docx", "format": "docx"}
+
+        try:
+            core_props = CoreProperties(parse_xml(archive.read("docProps/core.xml")))
+            if core_props.title:
+                metadata["title"] = core_props.title
+            if core_props.author:
+                metadata["author"] = core_props.author
+            if core_props.subject:
+                metadata["subject"] = core_props.subject
+            if core_props.created:
+                metadata["created"] = core_props.created.isoformat()
+            if core_props.modified:
+                metadata["modified"] = core_props.modified.isoformat()
+        except Exception as e:
+            self.logger.warning(f"Could not extract core properties: {e}")
+
+        return metadata
+
+    def _extract_content_python_docx(self, doc) -> Tuple[str, Dict[str, int]]:
+        """
+        Extract content from python-docx document.
+
+        Paragraphs and tables are taken in document order in a single pass,
+        and counted on the way for the metadata.
+
+        :param doc: python-docx Document object
+        :return: Extracted content as markdown, and document statistics
+        """
+        content_parts = []
+        style_names: Dict[Optional[str], str] = {}  # Style name by style id
+        paragraph_count = 0
+        table_count = 0
+
+        for block in doc.iter_inner_content():
+            if isinstance(block, Table):
+                table_count += 1
+                content_parts.append(
+                    self._convert_table_to_markdown(
+                        [cell.text for cell in row.cells] for row in block.rows
+                    )
+                )
+                content_parts.append("")  # Add blank line
+                continue
+
+            paragraph_count += 1
+            text = block.text.strip()
+            if text:
+                # paragraph.style searches the styles part on every access,
+                # so each style id is resolved once
+                style_id = block._p.style
+                style_name = style_names.get(style_id)
+                if style_name is None:
+                    style_name = style_names[style_id] = block.style.name
+                content_parts.append(self._format_paragraph(text, style_name))
                 content_parts.append("")  # Add blank line
 
-        # Extract tables
-        for table in doc.tables:
-            content_parts.append(self._convert_table_to_markdown(table))
-            content_parts.append("")  # Add blank line
+        stats = {
+            "paragraph_count": paragraph_count,
+            "table_count": table_count,
+            "section_count": len(doc.sections),
+        }
+        return "\n".join(content_parts), stats
 
-        return "\n".join(content_parts)
+    def _format_paragraph(self, text: str, style: str) -> str:
+        """
+        Format a paragraph as markdown according to its style.
 
-    def _convert_table_to_markdown(self, table) -> str:
+        :param text: Stripped paragraph text
+        :param style: Paragraph style name
+        :return: Markdown line for the paragraph
         """
-        Convert a python-docx table to markdown.
+        return _heading_prefix(style) + text
 
-        :param table: python-docx table object
-        :return: Markdown table string
+    def _convert_table_to_markdown(self, rows: Iterable[Iterable[str]]) -> str:
         """
-        if not table.rows:
-            return ""
+        Convert table rows to markdown.
 
+        :param rows: Cell texts of each table row
+        :return: Markdown table string
+        """
         markdown_lines = []
 
         # Process each row
-        for i, row in enumerate(table.rows):
-            cells = []
-            for cell in row.cells:
-                # Get cell text and clean it
-                cell_text = cell.text.strip().replace("\n", " ")
-                cells.append(cell_text)
+        for i, row in enumerate(rows):
+            # Clean the cell text; pipes would otherwise end the cell early
+            cells = [
+                cell_text.strip().replace("\n", " ").replace("|", "\\|")
+                for cell_text in row
+            ]
 
             # Create markdown row
             markdown_row = "| " + " | ".join(cells) + " |"
@@ -263,26 +668,35 @@ class WordParser(BaseParser):
 
         return "\n".join(markdown_lines)
 
-    def _extract_metadata_mammoth(self, file_path: Path) -> Dict[str, Any]:
+    def _extract_metadata_mammoth(
+        self, file_path: Path, stat_result: Optional[os.stat_result] = None
+    ) -> Dict[str, Any]:
         """
         Extract metadata using mammoth.
 
         :param file_path: Path to the Word document
+        :param stat_result: Stat result from :meth:`validate_file`, if available
         :return: Dictionary of metadata
         """
+        if stat_result is None:
+            stat_result = file_path.stat()
+
         # Mammoth doesn't provide much metadata, so we'll use file info
         return {
             "parser": "mammoth",
             "file_path": str(file_path),
-            "file_size": file_path.stat().st_size,
+            "file_size": stat_result.st_size,
             "format": "docx",
         }
 
-    def _extract_metadata_python_docx(self, doc) -> Dict[str, Any]:
+    def _extract_metadata_python_docx(
+        self, doc, stats: Dict[str, int]
+    ) -> Dict[str, Any]:
         """
         Extract metadata from python-docx document.
 
         :param doc: python-docx Document object
+        :param stats: Document statistics from :meth:`_extract_content_python_docx`
         :return: Dictionary of metadata
         """
         metadata = {"parser": "python-docx", "format": "docx"}
@@ -303,13 +717,7 @@ class WordParser(BaseParser):
         except Exception as e:
             self.logger.warning(f"Could not extract core properties: {e}")
 
-        # Extract document statistics
-        try:
-            metadata["paragraph_count"] = len(doc.paragraphs)
-            metadata["table_count"] = len(doc.tables)
-            metadata["section_count"] = len(doc.sections)
-        except Exception as e:
-            self.logger.warning(f"Could not extract document statistics: {e}")
+        metadata.update(stats)
 
         return metadata
 
@@ -377,3 +785,100 @@ class WordParser(BaseParser):
             },
             "config": self.default_config,
         }
+
+
+def _parse_word_file(
+    file_path: Union[str, Path], config: Optional[Dict[str, Any]]
+) -> ParserResult:
+    """
+    Parse one Word document with a fresh parser; used by worker processes.
+
+    :param file_path: Path to the Word document
+    :param config: Configuration dictionary for the parser
+    :return: ParserResult for the document
+    """
+    return WordParser(config).parse(file_path)
+
+
+def _paragraph_text(paragraph) -> str:
+    """
+    Join the text of a w:p element's runs, as python-docx's Paragraph.text.
+
+    :param paragraph: w:p element
+    :return: Paragraph text
+    """
+    parts = []
+    for child in paragraph:
+        if child.tag == _W_R:
+            runs: Iterable = (child,)
+        elif child.tag == _W_HYPERLINK:
+            runs = child.findall(_W_R)
+        else:
+            continue
+
+        for run in runs:
+            for item in run:
+                tag = item.tag
+                if tag == _W_T:
+                    parts.append(item.text or "")
+                elif tag == _W_BR:
+                    if item.get(_W_TYPE, "textWrapping") == "textWrapping":
+                        parts.append("\n")
+                elif tag in _RUN_TEXT:
+                    parts.append(_RUN_TEXT[tag])
+
+    return "".join(parts)
+
+
+def _table_cell_texts(table) -> Iterator[List[str]]:
+    """
+    Yield the cell texts of each row of a w:tbl element.
+
+    Like python-docx's row.cells, a cell spanning several grid columns is
+    repeated once per column, and vertically merged cells repeat the text
+    of the cell they continue.
+
+    :param table: w:tbl element
+    :return: Iterator over lists of cell texts
+    """
+    above: Dict[int, str] = {}  # Cell text by grid offset in the previous row
+    for row in table.findall(_W_TR):
+        grid_before = row.find(_GRID_BEFORE_PATH)
+        offset = int(grid_before.get(_W_VAL)) if grid_before is not None else 0
+        texts = []
+        starts = {}
+
+        for cell in row.findall(_W_TC):
+            merge = cell.find(_V_MERGE_PATH)
+            if merge is not None and merge.get(_W_VAL, "continue") == "continue":
+                text = above.get(offset, "")
+            else:
+                text = "\n".join(_paragraph_text(p) for p in cell.findall(_W_P))
+
+            span = cell.find(_GRID_SPAN_PATH)
+            span = int(span.get(_W_VAL)) if span is not None else 1
+            starts[offset] = text
+            texts.extend([text] * span)
+            offset += span
+
+        above = starts
+        yield texts
+
+
+@functools.lru_cache(maxsize=256)
+def _heading_prefix(style: str) -> str:
+    """
+    Get the markdown heading prefix for a paragraph style.
+
+    Documents use a handful of styles, so each name is inspected once.
+
+    :param style: Paragraph style name, e.g. "Heading 2"
+    :return: Heading marker such as "## ", or "" for body text
+    """
+    style = style.lower()
+    if "heading" not in style:
+        return ""
+
+    level = style.replace("heading", "").strip()
+    heading_level = int(level) if level.isdigit() else 1
+    return f"{'#' * heading_level} "
@@ -0,0 +1,114 @@
+"""
+Unit tests for the base parser interface and parser registry.
+
+Tests extension-based parser dispatch, registration precedence and the
+single-stat file validation helpers and spool-backed parser results.
+"""
+
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import List, Union
+
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from markdown_converter.core.exceptions import ParserError
+from markdown_converter.parsers.base import (
+    BaseParser,
+    ParserRegistry,
+    ParserResult,
+    SpooledParserResult,
+)
+
+
+class _StubParser(BaseParser):
+    """Minimal parser used to exercise the registry."""
+
+    def __init__(self, formats: List[str]) -> None:
+        super().__init__()
+        self._formats = formats
+
+    def can_parse(self, file_path: Union[str, Path]) -> bool:
+        return Path(file_path).suffix.lower() in self._formats
+
+    def parse(self, file_path: Union[str, Path]) -> ParserResult:
+        return ParserResult(content="", metadata={}, format="markdown")
+
+    def get_supported_formats(self) -> List[str]:
+        return self._formats
+
+
+class TestParserRegistry:
+    """Test cases for ParserRegistry dispatch."""
+
+    def test_dispatch_by_extension(self):
+        """Test that files are routed by their lower-cased extension."""
+        registry = ParserRegistry()
+        pdf_parser = _StubParser([".pdf"])
+        html_parser = _StubParser([".html", ".htm"])
+        registry.register_parser(pdf_parser)
+        registry.register_parser(html_parser)
+
+        assert registry.get_parser_for_file("report.PDF") is pdf_parser
+        assert registry.get_parser_for_file("page.htm") is html_parser
+        assert registry.get_parser_for_file("notes.unknown") is None
+
+    def test_first_registration_wins(self):
+        """Test that earlier parsers keep precedence for shared extensions."""
+        registry = ParserRegistry()
+        first = _StubParser([".docx"])
+        second = _StubParser([".docx", ".odt"])
+        registry.register_parser(first)
+        registry.register_parser(second)
+
+        assert registry.get_parser_for_file("a.docx") is first
+        assert registry.get_parser_for_file("a.odt") is second
+        assert sorted(registry.get_supported_formats()) == [".docx", ".odt"]
+
+
+class TestBaseParser:
+    """Test cases for BaseParser helpers."""
+
+    def test_validate_file_returns_stat(self, tmp_path):
+        """Test that validation returns a stat result reusable for metadata."""
+        sample = tmp_path / "sample.pdf"
+        sample.write_bytes(b"%PDF-1.4")
+        parser = _StubParser([".pdf"])
+
+        st = parser.validate_file(sample)
+        metadata = parser._extract_metadata(sample, st)
+
+        assert metadata["file_size"] == 8
+        assert metadata["file_extension"] == ".pdf"
+
+    def test_validate_file_errors(self, tmp_path):
+        """Test that missing files and directories are rejected."""
+        parser = _StubParser([".pdf"])
+
+        with pytest.raises(ParserError):
+            parser.validate_file(tmp_path / "missing.pdf")
+
+        with pytest.raises(ParserError):
+            parser.validate_file(tmp_path)
+
+
+class TestSpooledParserResult:
+    """Test cases for spool-backed parser results."""
+
+    def test_content_read_lazily_from_spool(self):
+        """Test chunked reads, lazy content and pickling as ParserResult."""
+        spool = tempfile.SpooledTemporaryFile(max_size=4, mode="w+")
+        spool.write("# Title\n\nbody")
+        result = SpooledParserResult(spool, metadata={}, format="markdown")
+
+        assert "".join(result.iter_content(chunk_size=3)) == "# Title\n\nbody"
+        assert result.content == "# Title\n\nbody"
+        assert spool.closed
+
+        restored = pickle.loads(pickle.dumps(result))
+        assert type(restored) is ParserResult
+        assert restored.content == result.content
@@ -0,0 +1,142 @@
+"""
+Unit tests for the Excel parser.
+
+Tests sheet extraction limits (bogus stored dimensions, runs of empty
+rows, per-sheet cell budget) and markdown cell escaping.
+"""
+
+import io
+import re
+import sys
+import zipfile
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+openpyxl = pytest.importorskip("openpyxl")
+
+from markdown_converter.parsers.excel_parser import ExcelParser
+
+
+def _write_workbook(path: Path, rows, dimension: Optional[str] = None) -> Path:
+    """Save rows to an .xlsx file, optionally overriding its <dimension>."""
+    workbook = openpyxl.Workbook()
+    for row in rows:
+        workbook.active.append(row)
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+
+    with zipfile.ZipFile(buffer) as zin, zipfile.ZipFile(path, "w") as zout:
+        for item in zin.infolist():
+            data = zin.read(item.filename)
+            if dimension and item.filename == "xl/worksheets/sheet1.xml":
+                data = re.sub(
+                    rb'<dimension ref="[^"]*"',
+                    b'<dimension ref="' + dimension.encode() + b'"',
+                    data,
+                )
+            zout.writestr(item, data)
+
+    return path
+
+
+class TestExcelParser:
+    """Test cases for ExcelParser sheet extraction."""
+
+    @pytest.fixture
+    def parser(self):
+        """Create an ExcelParser instance for testing."""
+        return ExcelParser()
+
+    @pytest.mark.parametrize("dimension", ["A1", "A1:XFD1048576"])
+    def test_bogus_dimensions_are_ignored(self, parser, tmp_path, dimension):
+        """Test that wrong <dimension> metadata neither truncates nor pads."""
+        path = _write_workbook(
+            tmp_path / "bogus.xlsx", [["a", "b", "c"], [1, 2, 3]], dimension
+        )
+
+        result = parser._parse_with_openpyxl(path)
+
+        assert "| a | b | c |\n| --- | --- | --- |\n| 1 | 2 | 3 |" in result.content
+        assert result.metadata["sheets"][0]["columns"] == 3
+
+    def test_stops_after_empty_rows(self, tmp_path):
+        """Test that reading stops after max_empty_rows blank rows."""
+        rows = [["head"], ["kept"]] + [[None]] * 5 + [["dropped"]]
+        path = _write_workbook(tmp_path / "gap.xlsx", rows)
+        # Give the blank rows a value-less cell so openpyxl emits them
+        workbook = openpyxl.load_workbook(path)
+        for row in range(3, 8):
+            workbook.active.cell(row=row, column=1).number_format = "0.00"
+        workbook.save(path)
+
+        parser = ExcelParser(
+            {
+                "openpyxl_options": {
+                    "data_only": True,
+                    "read_only": True,
+                    "max_empty_rows": 3,
+                }
+            }
+        )
+        result = parser._parse_with_openpyxl(path)
+
+        assert "kept" in result.content
+        assert "dropped" not in result.content
+
+    def test_cells_are_escaped(self):
+        """Test that pipes are escaped and line breaks kept inside the row."""
+        table = ExcelParser._convert_data_to_markdown(
+            [["name", "note"], ["a|b", "line one\r\nline two"]]
+        )
+
+        assert table.splitlines() == [
+            "| name | note |",
+            "| --- | --- |",
+            "| a\\|b | line one line two |",
+        ]
+
+    @pytest.mark.parametrize(
+        "method",
+        [
+            "_parse_with_calamine",
+            "_parse_with_polars",
+            "_parse_with_pandas",
+            "_parse_with_openpyxl",
+        ],
+    )
+    def test_sheet_truncated_at_cell_budget(self, tmp_path, method):
+        """Test that extraction stops at max_cells_per_sheet with a note."""
+        rows = [["id", "value"]] + [[i, i * 10] for i in range(1, 11)]
+        path = _write_workbook(tmp_path / "big.xlsx", rows)
+        parser = ExcelParser({"max_cells_per_sheet": 8})
+
+        try:
+            result = getattr(parser, method)(path)
+        except ImportError as e:
+            pytest.skip(str(e))
+
+        assert "| 3 | 30 |" in result.content
+        assert "| 4 | 40 |" not in result.content
+        assert result.content.rstrip().endswith("*Sheet truncated at 8 cells*")
+
+    def test_result_cache(self, tmp_path, monkeypatch):
+        """Test that unchanged files are served from cache_dir."""
+        path = _write_workbook(tmp_path / "cached.xlsx", [["a"], [1]])
+        parser = ExcelParser({"cache_dir": str(tmp_path / "cache")})
+        first = parser.parse(path)
+
+        def fail(*args):
+            raise AssertionError("file was parsed again")
+
+        monkeypatch.setattr(parser, "_parse_file", fail)
+        assert parser.parse(path).content == first.content
+
+        # Changing the file invalidates the entry
+        _write_workbook(path, [["b"], [2], [3]])
+        monkeypatch.undo()
+        assert "| b |" in parser.parse(path).content
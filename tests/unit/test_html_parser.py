@@ -0,0 +1,139 @@
+"""
+Unit tests for the HTML parser.
+
+Tests that the lxml and beautifulsoup4 engines produce the same markdown
+and metadata, and that nested tables and lists are not repeated.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+pytest.importorskip("bs4")
+pytest.importorskip("lxml")
+
+from markdown_converter.parsers.html_parser import HTMLParser
+
+SAMPLE_HTML = """<!DOCTYPE html>
+<html>
+<head>
+  <title> Sample Page </title>
+  <meta name="description" content="A sample">
+  <meta property="og:title" content="Sample">
+  <style>p { color: red; }</style>
+</head>
+<body>
+  <h1>Heading <b>one</b></h1>
+  <p>Text with a <a href="#">link</a> &amp; an <img src="x.png"> image.</p>
+  <p>   </p>
+  <script>document.write("<p>hidden</p>");</script>
+  <div><h3>Nested heading</h3></div>
+  <table>
+    <tr><th>Name</th><th>Value|unit</th></tr>
+    <tr><td>a</td><td> 1 </td></tr>
+    <tr></tr>
+  </table>
+  <ul><li>first</li><li></li><li>second <i>item</i></li></ul>
+  <ol><li>step</li></ol>
+</body>
+</html>
+"""
+
+
+class TestHTMLParser:
+    """Test cases for HTMLParser markdown conversion."""
+
+    @pytest.fixture
+    def html_file(self, tmp_path):
+        """Write the sample document to a temporary file."""
+        path = tmp_path / "sample.html"
+        path.write_text(SAMPLE_HTML, encoding="utf-8")
+        return path
+
+    def test_lxml_engine_matches_beautifulsoup(self, html_file):
+        """Test that both engines produce identical markdown and metadata."""
+        lxml_result = HTMLParser({"engine": "lxml"}).parse(html_file)
+        bs4_result = HTMLParser({"engine": "beautifulsoup4"}).parse(html_file)
+
+        assert lxml_result.metadata.pop("parser") == "lxml"
+        assert bs4_result.metadata.pop("parser") == "beautifulsoup4"
+        assert lxml_result.content == bs4_result.content
+        assert lxml_result.metadata == bs4_result.metadata
+
+    def test_markdown_conversion(self, html_file):
+        """Test the markdown produced for headings, tables and lists."""
+        result = HTMLParser().parse(html_file)
+
+        assert result.content.splitlines() == [
+            "# Sample Page",
+            "",
+            "# Heading one",
+            "",
+            "Text with a link & an  image.",
+            "",
+            "### Nested heading",
+            "",
+            "| Name | Value\\|unit |",
+            "| --- | --- |",
+            "| a | 1 |",
+            "",
+            "- first",
+            "- second item",
+            "",
+            "1. step",
+        ]
+        assert result.metadata["meta_description"] == "A sample"
+        assert result.metadata["headings"]["h3"] == 1
+        assert result.metadata["links"] == 1
+        assert result.metadata["images"] == 1
+
+    def test_nested_tables_and_lists_not_repeated(self, tmp_path):
+        """Test that nested rows and items only appear in their parent cell."""
+        path = tmp_path / "nested.html"
+        path.write_text(
+            "<table><thead><tr><th>a</th><th>b</th></tr></thead><tbody>"
+            "<tr><td><table><tr><td>x</td><td>y</td></tr></table></td><td>z</td>"
+            "</tr></tbody></table>"
+            "<ul><li>outer<ul><li>inner</li></ul></li></ul>",
+            encoding="utf-8",
+        )
+
+        for engine in ("lxml", "beautifulsoup4"):
+            result = HTMLParser({"engine": engine}).parse(path)
+
+            assert result.content.splitlines() == [
+                "| a | b |",
+                "| --- | --- |",
+                "| xy | z |",
+                "",
+                "| x | y |",
+                "| --- | --- |",
+                "",
+                "- outerinner",
+                "",
+                "- inner",
+            ]
+
+    def test_parse_many_matches_parse(self, html_file, tmp_path):
+        """Test that parallel parsing returns per-file results in order."""
+        other = tmp_path / "other.html"
+        other.write_text("<h2>Other</h2>", encoding="utf-8")
+        paths = [html_file, other, html_file]
+
+        results = HTMLParser.parse_many(paths, workers=2)
+
+        assert [result.content for result in results] == [
+            HTMLParser().parse(path).content for path in paths
+        ]
+
+    def test_streaming_matches_tree_parse(self, html_file):
+        """Test that streaming large files gives the same result as the tree."""
+        streamed = HTMLParser({"stream_threshold": 0}).parse(html_file)
+        parsed = HTMLParser().parse(html_file)
+
+        assert streamed.content == parsed.content
+        assert streamed.metadata == parsed.metadata
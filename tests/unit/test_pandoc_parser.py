@@ -0,0 +1,77 @@
+"""
+Unit tests for the Pandoc parser.
+
+pypandoc is patched so the tests run without a pandoc installation.
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+pypandoc = pytest.importorskip("pypandoc")
+
+from markdown_converter.parsers.pandoc_parser import PandocParser
+
+
+class TestPandocParser:
+    """Test cases for PandocParser without a pandoc binary."""
+
+    @pytest.fixture
+    def parser(self, monkeypatch):
+        """Create a PandocParser with pypandoc's pandoc calls patched."""
+        monkeypatch.setattr(pypandoc, "get_pandoc_version", lambda: "3.7")
+        return PandocParser()
+
+    def test_convert_files_keeps_input_order(self, parser, tmp_path, monkeypatch):
+        """Test that batch conversion runs concurrently and keeps order."""
+        paths = [tmp_path / f"doc{i}.md" for i in range(4)]
+        barrier = threading.Barrier(len(paths), timeout=5)
+
+        def fake_convert(source, to, format, extra_args):
+            barrier.wait()  # Only passes if all conversions run at once
+            return f"{Path(source).name} {' '.join(extra_args)}"
+
+        monkeypatch.setattr(pypandoc, "convert_file", fake_convert)
+        parser.default_config["batch_workers"] = len(paths)
+
+        results = parser.convert_files(paths)
+
+        assert [result.split()[0] for result in results] == [
+            path.name for path in paths
+        ]
+        assert "--wrap none" in results[0]
+
+    def test_can_parse_checks_extension_only(self, parser, tmp_path, monkeypatch):
+        """Test that can_parse never opens the file."""
+
+        def fail(*args, **kwargs):
+            raise AssertionError("file was opened")
+
+        monkeypatch.setattr("builtins.open", fail)
+
+        assert parser.can_parse(tmp_path / "notes.RST")
+        assert not parser.can_parse(tmp_path / "notes.unknown")
+
+    def test_extra_args_cache_tells_bools_from_ints(self, parser):
+        """Test that True/1 and False/0 are not served each other's arguments."""
+        assert parser._build_extra_args({"columns": True}) == ["--columns"]
+        assert parser._build_extra_args({"columns": 1}) == ["--columns", "1"]
+        assert parser._build_extra_args({"x": 0}) == ["--x", "0"]
+        assert parser._build_extra_args({"x": False}) == ["--x=false"]
+
+    def test_convert_file_options_do_not_leak(self, parser, tmp_path, monkeypatch):
+        """Test that per-call options never change the default settings."""
+        monkeypatch.setattr(
+            pypandoc,
+            "convert_file",
+            lambda source, to, format, extra_args: " ".join(extra_args),
+        )
+        path = tmp_path / "doc.md"
+
+        assert "--wrap auto" in parser.convert_file(path, options={"wrap": "auto"})
+        assert "--wrap none" in parser.convert_file(path)
@@ -0,0 +1,230 @@
+"""
+Unit tests for the PDF parser.
+
+Test documents are generated with PyMuPDF so no sample files are needed.
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+fitz = pytest.importorskip("fitz")
+pytest.importorskip("pdfplumber")
+
+from markdown_converter.core.exceptions import ParserError
+from markdown_converter.parsers.base import SpooledParserResult
+from markdown_converter.parsers.pdf_parser import (
+    PDFParser,
+    _close_discarded_result,
+    _separator_cells,
+)
+
+
+class TestPDFParser:
+    """Test cases for PDFParser page extraction."""
+
+    @pytest.fixture
+    def pdf_file(self, tmp_path):
+        """Write a small multi-page PDF to a temporary file."""
+        path = tmp_path / "sample.pdf"
+        doc = fitz.open()
+        for page_num in range(1, 6):
+            page = doc.new_page()
+            page.insert_text((72, 72), f"Page {page_num} heading", fontsize=14)
+            page.insert_text((72, 100), f"Body text of page {page_num}.")
+        doc.save(path)
+        doc.close()
+        return path
+
+    def test_threaded_pages_match_sequential(self, pdf_file):
+        """Test that threaded extraction keeps page order and content."""
+        sequential = PDFParser({"threads": 1}).parse(pdf_file)
+        threaded = PDFParser({"threads": 3, "parallel_min_pages": 0}).parse(pdf_file)
+
+        assert threaded.content == sequential.content
+        assert threaded.metadata == sequential.metadata
+        assert sequential.content.index("## Page 2") < sequential.content.index(
+            "## Page 5"
+        )
+
+    def test_page_ranges_in_processes_match_sequential(self, pdf_file):
+        """Test that process-pool extraction keeps page order and content."""
+        config = {"processes": 2, "process_min_pages": 0, "process_chunk_pages": 2}
+
+        for backend in ({}, {"use_pdfplumber": False}):
+            sequential = PDFParser({"threads": 1, **backend}).parse(pdf_file)
+            in_processes = PDFParser({**config, **backend}).parse(pdf_file)
+
+            assert in_processes.content == sequential.content
+            assert in_processes.metadata == sequential.metadata
+
+    def test_short_documents_are_extracted_sequentially(self):
+        """Test that threads are opt-in and only used above parallel_min_pages."""
+        parser = PDFParser({"threads": 4})
+
+        assert parser._page_workers(10) == 1
+        assert parser._page_workers(11) == 4
+        assert parser._page_workers(500) == 4
+        assert PDFParser()._page_workers(500) == 1
+
+    def test_detected_rows_are_not_split_at_bucket_edges(self):
+        """Test that blocks within the Y tolerance share a row."""
+        blocks = [
+            {"text": text, "bbox": (x, y, x + 10, y + 10), "y": y}
+            for text, x, y in [
+                ("b", 50, 7.6),
+                ("a", 10, 7.4),
+                ("d", 50, 20.0),
+                ("c", 10, 21.0),
+            ]
+        ]
+
+        tables = PDFParser()._detect_tables_from_text_blocks(blocks, 1)
+
+        assert tables[0]["content"].splitlines() == [
+            "| a | b |",
+            "| --- | --- |",
+            "| c | d |",
+        ]
+
+    def test_table_separator_is_memoized(self):
+        """Test that tables with the same width reuse the cached separator."""
+        parser = PDFParser()
+        _separator_cells.cache_clear()
+
+        first = parser._convert_table_to_markdown([["a", "b"], ["1", "2"]])
+        second = parser._convert_table_to_markdown([["c", "d"], ["3", "4"]])
+
+        assert first.splitlines()[1] == second.splitlines()[1] == "| --- | --- |"
+        info = _separator_cells.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_cache_is_keyed_by_content(self, pdf_file, tmp_path, monkeypatch):
+        """Test that a copy of a parsed file is served from the cache."""
+        config = {"cache_dir": str(tmp_path / "cache")}
+        first = PDFParser(config).parse(pdf_file)
+        copy = tmp_path / "copy.pdf"
+        copy.write_bytes(pdf_file.read_bytes())
+
+        def fail(*args, **kwargs):
+            raise AssertionError("file was parsed again")
+
+        monkeypatch.setattr(PDFParser, "_parse_file", fail)
+        cached = PDFParser(config).parse(copy)
+
+        assert cached.content == first.content
+        assert cached.metadata["file_path"] == str(copy)
+
+    def test_race_backends_falls_back_to_the_other_result(self, pdf_file, monkeypatch):
+        """Test that a failing backend loses the race to the other one."""
+
+        def fail(*args, **kwargs):
+            raise RuntimeError("backend failed")
+
+        monkeypatch.setattr(PDFParser, "_parse_with_pdfplumber", fail)
+        result = PDFParser({"race_backends": True}).parse(pdf_file)
+
+        assert result.metadata["parser"] == "pymupdf"
+        assert "Body text of page 3." in result.content
+
+    def test_race_backends_closes_the_losing_result(self, pdf_file, monkeypatch):
+        """Test that the slower backend's spooled result is closed when it ends."""
+        release = threading.Event()
+        spool = tempfile.SpooledTemporaryFile(mode="w+")
+        spool.write("loser")
+
+        def slow(*args, **kwargs):
+            release.wait(5)
+            return SpooledParserResult(spool, metadata={}, format="markdown")
+
+        monkeypatch.setattr(PDFParser, "_parse_with_pymupdf", slow)
+        result = PDFParser({"race_backends": True}).parse(pdf_file)
+        release.set()
+
+        assert result.metadata["parser"] == "pdfplumber"
+        for _ in range(50):
+            if spool.closed:
+                break
+            time.sleep(0.1)
+        assert spool.closed
+
+    def test_back_to_back_races_never_overlap_pymupdf(self, pdf_file, monkeypatch):
+        """Test that an abandoned PyMuPDF run finishes before the next starts."""
+        process_page = PDFParser._process_pymupdf_page
+        lock = threading.Lock()
+        active = []
+        overlaps = []
+        pages_done = []
+
+        def slow_page(parser, page, page_num):
+            with lock:
+                active.append(page_num)
+                overlaps.append(len(active) > 1)
+            time.sleep(0.1)
+            try:
+                return process_page(parser, page, page_num)
+            finally:
+                with lock:
+                    active.remove(page_num)
+                    pages_done.append(page_num)
+
+        monkeypatch.setattr(PDFParser, "_process_pymupdf_page", slow_page)
+        parser = PDFParser({"race_backends": True})
+        parser.parse(pdf_file)
+        parser.parse(pdf_file)
+
+        for _ in range(50):
+            if len(pages_done) == 10:
+                break
+            time.sleep(0.1)
+        assert len(pages_done) == 10
+        assert not any(overlaps)
+
+    def test_race_callback_holds_no_futures(self):
+        """Test that the done-callback is not memoized but the separator is."""
+        assert not hasattr(_close_discarded_result, "cache_info")
+        assert _separator_cells.cache_info().maxsize == 128
+
+    def test_files_without_pdf_header_are_rejected(self, tmp_path, monkeypatch):
+        """Test that non-PDF content fails before any backend runs."""
+        path = tmp_path / "fake.pdf"
+        path.write_bytes(b"PK\x03\x04 not a pdf")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("backend was run")
+
+        monkeypatch.setattr(PDFParser, "_parse_file", fail)
+
+        with pytest.raises(ParserError, match="Not a PDF document"):
+            PDFParser().parse(path)
+
+    def test_blank_pages_skip_extraction(self, tmp_path, monkeypatch):
+        """Test that pages without characters are not laid out as text."""
+        from pdfplumber.page import Page
+
+        path = tmp_path / "blank.pdf"
+        doc = fitz.open()
+        doc.new_page().insert_text((72, 72), "Only page with text")
+        doc.new_page()
+        doc.save(path)
+        doc.close()
+
+        extract_text = Page.extract_text
+        extracted = []
+
+        def tracking_extract_text(page, *args, **kwargs):
+            extracted.append(page.page_number)
+            return extract_text(page, *args, **kwargs)
+
+        monkeypatch.setattr(Page, "extract_text", tracking_extract_text)
+        result = PDFParser().parse(path)
+
+        assert extracted == [1]
+        assert "## Page 2" not in result.content
@@ -0,0 +1,146 @@
+"""
+Unit tests for the Word parser.
+
+Test documents are generated with python-docx so no sample files are needed.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+docx = pytest.importorskip("docx")
+pytest.importorskip("lxml")
+
+from markdown_converter.core.exceptions import ParserError
+from markdown_converter.parsers.word_parser import WordParser
+
+
+class TestWordParser:
+    """Test cases for WordParser markdown extraction."""
+
+    @pytest.fixture
+    def docx_file(self, tmp_path):
+        """Write a document with headings, merged cells and sections."""
+        path = tmp_path / "sample.docx"
+        doc = docx.Document()
+        doc.core_properties.title = "Sample"
+        doc.add_heading("Introduction", 1)
+        paragraph = doc.add_paragraph("Tab\there ")
+        paragraph.add_run("line").add_break()
+        paragraph.add_run("next")
+        table = doc.add_table(rows=3, cols=3)
+        for i, row in enumerate(table.rows):
+            for j, cell in enumerate(row.cells):
+                cell.text = f"r{i}c{j}"
+        table.cell(0, 0).merge(table.cell(0, 1))
+        table.cell(1, 2).merge(table.cell(2, 2))
+        table.cell(2, 1).add_table(rows=1, cols=1).cell(0, 0).text = "nested"
+        doc.add_heading("Details", 2)
+        doc.add_section()
+        doc.add_paragraph("Closing")
+        doc.save(path)
+        return path
+
+    def test_streaming_matches_python_docx(self, docx_file):
+        """Test that iterparse gives the same result as the Document tree."""
+        config = {"use_mammoth": False}
+        loaded = WordParser({**config, "stream_python_docx": False}).parse(docx_file)
+
+        for xml_parser in ("etree", "lxml"):
+            parser = WordParser({**config, "streaming_xml_parser": xml_parser})
+            streamed = parser.parse(docx_file)
+
+            assert streamed.content == loaded.content
+            assert streamed.metadata == loaded.metadata
+
+        assert streamed.content.splitlines()[:12] == [
+            "# Introduction",
+            "",
+            "Tab\there line",
+            "next",
+            "",
+            "| r0c0 r0c1 | r0c0 r0c1 | r0c2 |",
+            "| --- | --- | --- |",
+            "| r1c0 | r1c1 | r1c2 r2c2 |",
+            "| r2c0 | r2c1 | r1c2 r2c2 |",
+            "",
+            "## Details",
+            "",
+        ]
+        assert streamed.metadata["section_count"] == 2
+
+    def test_cache_is_keyed_by_content(self, docx_file, tmp_path, monkeypatch):
+        """Test that a copy of a parsed file is served from the cache."""
+        config = {"use_mammoth": False, "cache_dir": str(tmp_path / "cache")}
+        first = WordParser(config).parse(docx_file)
+        copy = tmp_path / "copy.docx"
+        copy.write_bytes(docx_file.read_bytes())
+
+        def fail(*args, **kwargs):
+            raise AssertionError("file was parsed again")
+
+        monkeypatch.setattr(WordParser, "_parse_file", fail)
+        cached = WordParser(config).parse(copy)
+
+        assert cached.content == first.content
+        assert cached.metadata == first.metadata
+
+    def test_parse_many_serves_cache_hits_without_parsing(
+        self, docx_file, tmp_path, monkeypatch
+    ):
+        """Test that batch parsing keeps order and only parses cache misses."""
+        config = {"use_mammoth": False, "cache_dir": str(tmp_path / "cache")}
+        other = tmp_path / "other.docx"
+        document = docx.Document()
+        document.add_paragraph("Other document")
+        document.save(other)
+        paths = [docx_file, other, docx_file]
+
+        results = WordParser.parse_many(paths, config, workers=2)
+
+        assert [result.content for result in results] == [
+            WordParser({"use_mammoth": False}).parse(path).content for path in paths
+        ]
+
+        def fail(*args, **kwargs):
+            raise AssertionError("file was parsed again")
+
+        monkeypatch.setattr(WordParser, "_parse_file", fail)
+        cached = WordParser.parse_many(paths, config, workers=2)
+
+        assert [result.content for result in cached] == [
+            result.content for result in results
+        ]
+
+    def test_table_cells_are_cleaned(self):
+        """Test that cell newlines are joined and pipes escaped."""
+        markdown = WordParser()._convert_table_to_markdown(
+            [["Name", "Value|unit"], [" a ", "line one\nline two"]]
+        )
+
+        assert markdown.splitlines() == [
+            "| Name | Value\\|unit |",
+            "| --- | --- |",
+            "| a | line one line two |",
+        ]
+
+    def test_binary_doc_is_rejected_before_parsing(self, tmp_path, monkeypatch):
+        """Test that unconvertible non-ZIP content never reaches a backend."""
+        path = tmp_path / "legacy.doc"
+        path.write_bytes(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1 binary Word document")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("backend was run")
+
+        monkeypatch.setattr(WordParser, "_parse_with_mammoth", fail)
+        monkeypatch.setattr(WordParser, "_parse_with_python_docx", fail)
+        monkeypatch.setattr(
+            WordParser, "_ensure_readable_format", lambda self, file_path: file_path
+        )
+
+        with pytest.raises(ParserError, match="Not a .docx document"):
+            WordParser().parse(path)